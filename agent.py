@@ -6,24 +6,39 @@ This agent integrates with:
 - AgentCore Identity for Google Calendar OAuth authentication
 """
 
+import asyncio
+import atexit
 import contextvars
-import json
+import hashlib
 import logging
 import os
+import tempfile
 import threading
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from concurrent.futures import Future
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any, cast
 
 import boto3
 import httpx
-from bedrock_agentcore.identity.auth import requires_access_token
+import orjson
+from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
-from bedrock_agentcore.runtime.context import RequestContext
+from bedrock_agentcore.runtime.context import BedrockAgentCoreContext, RequestContext
+from bedrock_agentcore.services.identity import IdentityClient
+from cachetools import TTLCache
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import Tool
 from strands import Agent
-from strands.tools.mcp import MCPClient
+from strands.agent import AgentResult
+from strands.models import BedrockModel
+from strands.tools.executors import ConcurrentToolExecutor
+from strands.tools.mcp import MCPAgentTool, MCPClient, ToolFilters
+from strands.tools.mcp.mcp_types import MCPToolResult
+from strands.types.collections import PaginatedList
+from strands.types.exceptions import MCPClientInitializationError, ToolProviderException
 
 logger = logging.getLogger(__name__)
 
@@ -56,62 +71,261 @@ COGNITO_SECRET_NAME = _require_env("COGNITO_SECRET_NAME")
 GOOGLE_CREDENTIAL_PROVIDER = _require_env("GOOGLE_CREDENTIAL_PROVIDER")
 GOOGLE_OAUTH_CALLBACK_URL = _require_env("GOOGLE_OAUTH_CALLBACK_URL")
 
+# Bedrock model for the agent. Pinned here (not left to the Strands default) so the
+# model always matches the one the runtime role may invoke; CDK sets it from the
+# mynion:bedrockModelId context value.
+BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "apac.anthropic.claude-sonnet-4-20250514-v1:0")
+
+# Prefetch Cognito credentials and token during container init (opt-in)
+WARM_AUTH = os.getenv("MYNION_WARM_AUTH") == "1"
+
+# Secrets Manager client and secret cache (shared for the container lifecycle)
+_sm_session = boto3.session.Session()
+_sm_client = _sm_session.client("secretsmanager", region_name=AWS_REGION)
+_secret_cache = SecretCache(
+    config=SecretCacheConfig(secret_refresh_interval=3600),
+    client=_sm_client,
+)
+
+
+def _start_token_loop() -> asyncio.AbstractEventLoop:
+    """Start the long-lived event loop thread used for token lookups."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="token-loop", daemon=True).start()
+    return loop
+
+
+# Persistent event loop for Cognito and Google token lookups
+# (avoids creating a thread and an event loop per calendar tool call)
+_token_loop = _start_token_loop()
+
+# Async HTTP client for Cognito token requests (HTTP/2 + keep-alive, reused across
+# refreshes). Only used from coroutines running on _token_loop.
+_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=4),
+)
+
+
+def _close_http_client() -> None:
+    """Close the Cognito HTTP client on the loop that owns its connections."""
+    asyncio.run_coroutine_threadsafe(_http_client.aclose(), _token_loop).result(timeout=5)
+
+
+atexit.register(_close_http_client)
+
+# Cognito token refresh: a token is treated as expired this long before its real
+# expiry (at most half its lifetime, for short-lived tokens). The background
+# refresher waits at least COGNITO_REFRESH_RETRY_SECONDS between refreshes.
+COGNITO_REFRESH_MARGIN_SECONDS = 300
+COGNITO_REFRESH_RETRY_SECONDS = 60
+
+# Google token cache: AgentCore Identity returns only the access token, not its
+# expiry, and may hand back a vaulted token part-way through its 1 hour lifetime,
+# so tokens are reused only briefly before asking Identity again
+GOOGLE_TOKEN_CACHE_MAXSIZE = 1024
+GOOGLE_TOKEN_CACHE_TTL_SECONDS = 120
+# How long an authorization URL is reused for a user who still needs to consent
+GOOGLE_AUTH_URL_CACHE_TTL_SECONDS = 30
+
+# AgentCore Identity client shared by all Google token lookups
+_identity_client = IdentityClient(AWS_REGION)
+
 # Cache for tokens (with thread safety)
-_cache_lock = threading.Lock()
+# In-flight refreshes are tracked so concurrent cache misses share one fetch
+_cognito_lock = threading.Lock()
 _cognito_token_cache: dict[str, Any] = {}
-_google_token_cache: dict[str, str] = {}  # user_id -> token
+_cognito_refresh_task: asyncio.Task[str] | None = None  # only touched on _token_loop
+_cache_lock = threading.Lock()
+# user_id -> (token, expires_at), bounded LRU that evicts entries past their lifetime
+_google_token_cache: TTLCache[str, tuple[str, float]] = TTLCache(
+    maxsize=GOOGLE_TOKEN_CACHE_MAXSIZE, ttl=GOOGLE_TOKEN_CACHE_TTL_SECONDS
+)
+_google_token_futures: dict[str, Future[str]] = {}  # user_id -> in-flight fetch
+# user_id -> authorization URL (negative cache for users without a Google token)
+_google_auth_url_cache: TTLCache[str, str] = TTLCache(
+    maxsize=GOOGLE_TOKEN_CACHE_MAXSIZE, ttl=GOOGLE_AUTH_URL_CACHE_TTL_SECONDS
+)
 
 
 def get_cognito_credentials() -> dict[str, str]:
-    """Get Cognito OAuth credentials from Secrets Manager."""
-    client = boto3.client("secretsmanager", region_name=AWS_REGION)
-    response = client.get_secret_value(SecretId=COGNITO_SECRET_NAME)
-    return cast(dict[str, str], json.loads(response["SecretString"]))
+    """Get Cognito OAuth credentials from Secrets Manager (cached in-process)."""
+    return cast(dict[str, str], orjson.loads(_secret_cache.get_secret_string(COGNITO_SECRET_NAME)))
+
+
+async def _fetch_cognito_access_token() -> str:
+    """Fetch a new access token from Cognito and store it in the cache."""
+    creds = await asyncio.to_thread(get_cognito_credentials)
+    response = await _http_client.post(
+        creds["token_endpoint"],
+        data={
+            "grant_type": "client_credentials",
+            "client_id": creds["client_id"],
+            "client_secret": creds["client_secret"],
+            "scope": creds["scope"],
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    token_data = orjson.loads(response.content)
+
+    # Cache the token, refreshing it COGNITO_REFRESH_MARGIN_SECONDS before expiry
+    access_token = cast(str, token_data["access_token"])
+    expires_in = int(token_data.get("expires_in", 3600))
+    margin = min(COGNITO_REFRESH_MARGIN_SECONDS, expires_in // 2)
+    with _cognito_lock:
+        _cognito_token_cache["token"] = access_token
+        _cognito_token_cache["expires_at"] = time.time() + expires_in - margin
 
+    return access_token
 
-def get_cognito_access_token() -> str:
-    """Get access token from Cognito using client_credentials flow (thread-safe)."""
-    import time
 
-    with _cache_lock:
-        # Check cache
-        if (
-            _cognito_token_cache.get("token")
-            and _cognito_token_cache.get("expires_at", 0) > time.time()
-        ):
-            return cast(str, _cognito_token_cache["token"])
-
-        # Get credentials and fetch new token
-        creds = get_cognito_credentials()
-        response = httpx.post(
-            creds["token_endpoint"],
-            data={
-                "grant_type": "client_credentials",
-                "client_id": creds["client_id"],
-                "client_secret": creds["client_secret"],
-                "scope": creds["scope"],
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        token_data = response.json()
-
-        # Cache the token (with 5 minute buffer before expiry)
-        access_token = cast(str, token_data["access_token"])
-        _cognito_token_cache["token"] = access_token
-        _cognito_token_cache["expires_at"] = time.time() + token_data.get("expires_in", 3600) - 300
+def _clear_cognito_refresh_task(_task: asyncio.Task[str]) -> None:
+    """Forget the finished refresh so the next cache miss starts a new one."""
+    global _cognito_refresh_task
+    _cognito_refresh_task = None
+
+
+def _get_cached_cognito_token() -> str | None:
+    """Return the cached Cognito token if it is still valid (thread-safe)."""
+    with _cognito_lock:
+        if _cognito_token_cache.get("expires_at", 0) > time.time():
+            return cast(str | None, _cognito_token_cache.get("token"))
+    return None
+
+
+async def _resolve_cognito_access_token(force_refresh: bool) -> str:
+    """Return the cached Cognito token or join/start a refresh (runs on _token_loop)."""
+    global _cognito_refresh_task
+
+    if not force_refresh and (token := _get_cached_cognito_token()) is not None:
+        return token
+
+    # Join the in-flight refresh if there is one, otherwise start it
+    task = _cognito_refresh_task
+    if task is None:
+        task = _cognito_refresh_task = asyncio.create_task(_fetch_cognito_access_token())
+        task.add_done_callback(_clear_cognito_refresh_task)
+
+    # Shield so a cancelled caller does not cancel the fetch shared with others
+    return await asyncio.shield(task)
+
+
+async def _get_cognito_access_token(force_refresh: bool = False) -> str:
+    """Get access token from Cognito using client_credentials flow.
+
+    Awaitable from any event loop: the request runs on the persistent token loop,
+    so the caller's loop keeps serving other work during the POST. Concurrent
+    callers that miss the cache share a single in-flight refresh instead of each
+    posting to the token endpoint.
+
+    Args:
+        force_refresh: Fetch a new token even if the cached one is still valid
+            (used by the background refresher).
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _resolve_cognito_access_token(force_refresh), _token_loop
+    )
+    return await asyncio.wrap_future(future)
+
+
+def get_cognito_access_token(force_refresh: bool = False) -> str:
+    """Synchronous wrapper around _get_cognito_access_token() (thread-safe).
 
-        return access_token
+    Must not be called from the token loop thread itself.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _resolve_cognito_access_token(force_refresh), _token_loop
+    )
+    return future.result()
+
+
+async def _cognito_refresher() -> None:
+    """Refresh the Cognito token in the background before the cached one expires.
+
+    Keeps CognitoBearerAuth, which reads the cached token on every Gateway
+    request, off the inline refresh path. Inline refresh in
+    _get_cognito_access_token() remains as the fallback.
+    """
+    while True:
+        # The refresh margin is already applied to the cached expires_at
+        expires_at = _cognito_token_cache.get("expires_at", 0)
+        delay = expires_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            # Re-check: an inline refresh may have replaced the token meanwhile
+            continue
+
+        try:
+            # Only force a refresh of a token that is about to expire; with nothing
+            # cached yet, join (or start) the regular fetch instead of a second one
+            await _get_cognito_access_token(force_refresh=bool(expires_at))
+            logger.info("Cognito access token refreshed in background")
+        except Exception as e:
+            logger.warning(f"Background Cognito token refresh failed: {e}")
+
+        # Floor between refreshes, so failures or short-lived tokens cannot busy-loop
+        await asyncio.sleep(COGNITO_REFRESH_RETRY_SECONDS)
+
+
+@asynccontextmanager
+async def _lifespan(_app: Any) -> AsyncIterator[None]:
+    """Run the background Cognito token refresher and warm the agent at startup."""
+    refresher = asyncio.create_task(_cognito_refresher())
+    # Warm in the background so /ping stays healthy even if the Gateway is slow or down
+    warmup = asyncio.create_task(asyncio.to_thread(_warm_agent))
+    try:
+        yield
+    finally:
+        refresher.cancel()
+        warmup.cancel()
+
+
+def _gateway_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """Create the httpx client for the Gateway MCP session.
+
+    Same defaults as the MCP SDK's factory, plus HTTP/2 and a keep-alive pool so
+    concurrent tool calls share multiplexed connections instead of new handshakes.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(30.0, read=300.0),
+        auth=auth,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+class CognitoBearerAuth(httpx.Auth):
+    """httpx auth that sends the current cached Cognito token on every request.
+
+    The Gateway MCP session lives as long as the shared agent, so the token is
+    read per request rather than fixed in the client headers at connect time.
+    """
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        # Serve cache hits directly instead of hopping to the token loop
+        token = _get_cached_cognito_token()
+        if token is None:
+            token = await _get_cognito_access_token()
+        request.headers["Authorization"] = f"Bearer {token}"
+        yield request
 
 
 @asynccontextmanager
 async def cognito_auth_streamablehttp_client(endpoint: str):
     """Create an MCP client with Cognito Bearer token authentication."""
-    token = get_cognito_access_token()
-    headers = {"Authorization": f"Bearer {token}"}
-
-    async with streamablehttp_client(endpoint, headers=headers) as streams:
+    async with streamablehttp_client(
+        endpoint, auth=CognitoBearerAuth(), httpx_client_factory=_gateway_http_client
+    ) as streams:
         yield streams  # (read, write, get_session_id)
 
 
@@ -120,78 +334,280 @@ def _raise_auth_required(url: str) -> None:
     raise AuthRequiredError(url)
 
 
-async def _get_google_token() -> str:
-    """Get Google OAuth token, raises AuthRequiredError if auth needed (thread-safe).
+def _get_cached_google_token(user_id: str | None) -> str | None:
+    """Return the user's cached Google token if it is still valid (thread-safe)."""
+    if not user_id:
+        return None
+    with _cache_lock:
+        cached = _google_token_cache.get(user_id)
+    if cached is not None and cached[1] > time.time():
+        return cast(str, cached[0])
+    return None
 
-    Tokens are cached per user_id to prevent cross-user token leakage.
-    """
-    # Get user_id for Session Binding (passed via custom_state)
-    user_id = _current_user_id.get()
 
-    # Check cache first (thread-safe)
-    with _cache_lock:
-        if user_id and user_id in _google_token_cache:
-            return _google_token_cache[user_id]
+async def _identity_token_lookup(user_id: str | None) -> tuple[str, int]:
+    """Look up the user's Google token on the shared IdentityClient.
+
+    Makes the same call as requires_access_token, but on the shared
+    IdentityClient instead of a new client per decorated function.
+
+    Returns:
+        Tuple of (access_token, seconds the token may be cached).
 
-    @requires_access_token(
+    Raises:
+        ValueError: If the Runtime did not supply a workload access token.
+    """
+    workload_access_token = BedrockAgentCoreContext.get_workload_access_token()
+    if workload_access_token is None:
+        raise ValueError("Workload access token has not been set by AgentCore Runtime")
+    access_token = await _identity_client.get_token(
         provider_name=GOOGLE_CREDENTIAL_PROVIDER,
+        agent_identity_token=workload_access_token,
         scopes=["https://www.googleapis.com/auth/calendar"],
-        auth_flow="USER_FEDERATION",
         on_auth_url=_raise_auth_required,
-        force_authentication=False,
+        auth_flow="USER_FEDERATION",
         callback_url=GOOGLE_OAUTH_CALLBACK_URL,  # Plain URL, no query params
+        force_authentication=False,
         custom_state=user_id,  # Pass user_id via custom_state for Session Binding
     )
-    async def fetch_token(*, access_token: str) -> str:
-        return access_token
+    return access_token, GOOGLE_TOKEN_CACHE_TTL_SECONDS
+
+
+async def _fetch_google_token(user_id: str | None) -> tuple[str, int]:
+    """Fetch the user's Google token from AgentCore Identity.
 
-    token = cast(str, await fetch_token())
+    The Identity SDK coroutines make blocking boto3 calls, so the lookup runs on
+    its own event loop in a worker thread (in the caller's context) instead of
+    stalling _token_loop, which also serves Cognito tokens and other lookups.
+
+    Returns:
+        Tuple of (access_token, seconds the token may be cached).
+    """
+    return await asyncio.to_thread(asyncio.run, _identity_token_lookup(user_id))
+
+
+async def _get_google_token() -> str:
+    """Get Google OAuth token, raises AuthRequiredError if auth needed (thread-safe).
+
+    Tokens are cached per user_id to prevent cross-user token leakage.
+    The in-memory cache only fronts AgentCore Identity: the Token Vault stores
+    each user's Google tokens durably and refreshes them with the stored refresh
+    token, so a new container gets a token without re-running the consent flow.
+    """
+    # Get user_id for Session Binding (passed via custom_state)
+    user_id = _current_user_id.get()
+
+    # Check cache first, then join an in-flight fetch for the same user (thread-safe)
+    future: Future[str] | None = None
+    is_owner = False
+    with _cache_lock:
+        if user_id:
+            cached = _google_token_cache.get(user_id)
+            if cached is not None and cached[1] > time.time():
+                return cast(str, cached[0])
+            # A user who just got an auth URL has not consented yet; skip Identity
+            auth_url = _google_auth_url_cache.get(user_id)
+            if auth_url is not None:
+                raise AuthRequiredError(auth_url)
+            future = _google_token_futures.get(user_id)
+            if future is None:
+                future = _google_token_futures[user_id] = Future()
+                is_owner = True
+
+    if future is not None and not is_owner:
+        return await asyncio.wrap_future(future)
+
+    try:
+        token, expires_in = await _fetch_google_token(user_id)
+    except BaseException as e:
+        if future is not None:
+            with _cache_lock:
+                _google_token_futures.pop(cast(str, user_id), None)
+                if isinstance(e, AuthRequiredError):
+                    _google_auth_url_cache[cast(str, user_id)] = e.auth_url
+            future.set_exception(e)
+        raise
 
     # Cache the token per user_id (thread-safe)
     with _cache_lock:
         if user_id:
-            _google_token_cache[user_id] = token
+            expires_at = time.time() + expires_in
+            _google_token_cache[user_id] = (token, expires_at)
+            _google_token_futures.pop(user_id, None)
+    if future is not None:
+        future.set_result(token)
 
     return token
 
 
+def _submit_google_token_lookup() -> Future[str]:
+    """Schedule _get_google_token() on the token loop with context preservation.
+
+    The lookup runs as a task on the persistent token loop, created in a copy of
+    the caller's context so _current_user_id and the AgentCore request context
+    are visible to _get_google_token().
+    """
+    context = contextvars.copy_context()
+    result: Future[str] = Future()
+
+    def on_done(task: asyncio.Task[str]) -> None:
+        if task.cancelled():
+            result.cancel()
+        elif (exc := task.exception()) is not None:
+            result.set_exception(exc)
+        else:
+            result.set_result(task.result())
+
+    def start() -> None:
+        task = _token_loop.create_task(_get_google_token(), context=context)
+        task.add_done_callback(on_done)
+
+    _token_loop.call_soon_threadsafe(start)
+    return result
+
+
 def get_google_token_sync() -> str:
     """Synchronously get Google OAuth token with context preservation.
 
-    Handles both cases:
-    - No event loop running: uses asyncio.run() directly
-    - Event loop already running: uses ThreadPoolExecutor to avoid nested asyncio.run()
+    Safe to call whether or not an event loop is running in the calling thread.
 
     Raises:
         AuthRequiredError: If user authentication is required.
     """
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
+    return _submit_google_token_lookup().result()
 
-    # Check if we're already in an event loop
-    try:
-        asyncio.get_running_loop()
-        in_event_loop = True
-    except RuntimeError:
-        in_event_loop = False
 
-    if not in_event_loop:
-        # No event loop - safe to use asyncio.run() directly
-        return asyncio.run(_get_google_token())
+# Gateway tool name prefix for calendar tools that need a Google access_token
+CALENDAR_TOOL_PREFIX = "calendar___"
+CALENDAR_TOOL_PREFIX_LEN = len(CALENDAR_TOOL_PREFIX)
+
+# Read-only tools whose identical concurrent calls are coalesced into one request
+COALESCED_TOOLS = frozenset({"calendar___get_events"})
+
+# Tool result text returned when the user must authorize Google Calendar access
+AUTH_REQUIRED_MESSAGE = "[認証が必要です] Google Calendar へのアクセスを許可してください: {}"
+
+
+# Gateway tool catalog cached on local disk to skip tools/list on process start
+# (max age overridable; bump the version to invalidate catalogs after tool changes)
+MCP_TOOL_CATALOG_TTL_SECONDS = int(os.getenv("MYNION_MCP_TOOLS_TTL", str(24 * 3600)))
+MCP_TOOLS_VERSION = os.getenv("MYNION_MCP_TOOLS_VERSION", "")
+
 
-    # Already in event loop - use thread to avoid nested asyncio.run()
-    def execute() -> str:
-        return asyncio.run(_get_google_token())
+def _tool_catalog_path(endpoint: str, version: str = "") -> str:
+    """Return the on-disk tool catalog path for a Gateway endpoint and catalog version."""
+    key = hashlib.sha256(f"{endpoint}\n{version}".encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"mynion-mcp-tools-{key}.json")
 
-    with ThreadPoolExecutor() as executor:
-        context = contextvars.copy_context()
-        future = executor.submit(context.run, execute)
-        return future.result()
+
+def _auth_required_result(tool_use_id: str, auth_url: str) -> MCPToolResult:
+    """Build the error tool result asking the user to authorize Google Calendar."""
+    return MCPToolResult(
+        toolUseId=tool_use_id,
+        content=[{"text": AUTH_REQUIRED_MESSAGE.format(auth_url)}],
+        status="error",
+    )
+
+
+def _hide_access_token_parameter(tool: MCPAgentTool) -> None:
+    """Drop the injected access_token parameter from a calendar tool's input schema."""
+    mcp_tool = tool.mcp_tool
+    schema = mcp_tool.inputSchema
+    properties = schema.get("properties", {})
+    if mcp_tool.name[:CALENDAR_TOOL_PREFIX_LEN] != CALENDAR_TOOL_PREFIX or (
+        "access_token" not in properties
+    ):
+        return
+
+    schema = {
+        **schema,
+        "properties": {k: v for k, v in properties.items() if k != "access_token"},
+    }
+    if "required" in schema:
+        schema["required"] = [name for name in schema["required"] if name != "access_token"]
+    tool.mcp_tool = mcp_tool.model_copy(update={"inputSchema": schema})
 
 
 class AuthInjectingMCPClient(MCPClient):
     """MCPClient that automatically injects Google OAuth token into calendar tool calls."""
 
+    def __init__(self, *args: Any, tool_catalog_path: str | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._tool_catalog_path = tool_catalog_path
+        # (tool name, serialized arguments) -> in-flight call, for COALESCED_TOOLS only
+        self._in_flight: dict[tuple[str, bytes], asyncio.Future[MCPToolResult]] = {}
+
+    def is_session_active(self) -> bool:
+        """Return True while the background MCP session thread is running."""
+        return self._is_session_active()
+
+    def list_tools_sync(
+        self,
+        pagination_token: str | None = None,
+        prefix: str | None = None,
+        tool_filters: ToolFilters | None = None,
+    ) -> PaginatedList[MCPAgentTool]:
+        """Override to serve the tool list from disk and hide injected parameters.
+
+        Only a complete, unprefixed and unfiltered listing is cached on disk;
+        everything else goes to the Gateway. Calendar tools are exposed to the
+        model without their access_token parameter, since it is injected here.
+        """
+        tools = self._list_tools(pagination_token, prefix, tool_filters)
+        for tool in tools:
+            _hide_access_token_parameter(tool)
+        return tools
+
+    def _list_tools(
+        self,
+        pagination_token: str | None,
+        prefix: str | None,
+        tool_filters: ToolFilters | None,
+    ) -> PaginatedList[MCPAgentTool]:
+        """List tools from the on-disk catalog while it is fresh, else from the Gateway."""
+        if (
+            self._tool_catalog_path is None
+            or pagination_token is not None
+            or prefix is not None
+            or tool_filters is not None
+        ):
+            return super().list_tools_sync(pagination_token, prefix, tool_filters)
+
+        cached = self._load_tool_catalog(self._tool_catalog_path)
+        if cached is not None:
+            return PaginatedList[MCPAgentTool](cached)
+
+        tools = super().list_tools_sync()
+        if tools.pagination_token is None:
+            self._save_tool_catalog(self._tool_catalog_path, tools)
+        return tools
+
+    def _load_tool_catalog(self, path: str) -> list[MCPAgentTool] | None:
+        """Load the cached tool catalog, or None if it is missing, stale or unreadable."""
+        try:
+            if time.time() - os.path.getmtime(path) > MCP_TOOL_CATALOG_TTL_SECONDS:
+                return None
+            with open(path, "rb") as f:
+                specs = orjson.loads(f.read())
+            return [MCPAgentTool(Tool.model_validate(spec), self) for spec in specs]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable MCP tool catalog {path}: {e}")
+            return None
+
+    @staticmethod
+    def _save_tool_catalog(path: str, tools: list[MCPAgentTool]) -> None:
+        """Write the tool catalog atomically (temp file + rename)."""
+        specs = [tool.mcp_tool.model_dump(mode="json", exclude_none=True) for tool in tools]
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(specs))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write MCP tool catalog {path}: {e}")
+
     def call_tool_sync(
         self,
         tool_use_id: str,
@@ -200,23 +616,16 @@ class AuthInjectingMCPClient(MCPClient):
         read_timeout_seconds: timedelta | None = None,
     ) -> Any:
         """Override to inject access_token for calendar tools."""
-        from strands.tools.mcp.mcp_types import MCPToolResult
-
         # Check if this is a calendar tool that needs access_token
-        if name.startswith("calendar___") and arguments is not None:
+        if arguments is not None and name[:CALENDAR_TOOL_PREFIX_LEN] == CALENDAR_TOOL_PREFIX:
             try:
-                token = get_google_token_sync()
+                # Serve cache hits directly instead of hopping to the token loop
+                token = _get_cached_google_token(_current_user_id.get())
+                if token is None:
+                    token = get_google_token_sync()
                 arguments["access_token"] = token
             except AuthRequiredError as e:
-                return MCPToolResult(
-                    toolUseId=tool_use_id,
-                    content=[
-                        {
-                            "text": f"[認証が必要です] Google Calendar へのアクセスを許可してください: {e.auth_url}"
-                        }
-                    ],
-                    status="error",
-                )
+                return _auth_required_result(tool_use_id, e.auth_url)
 
         return super().call_tool_sync(tool_use_id, name, arguments, read_timeout_seconds)
 
@@ -228,63 +637,161 @@ class AuthInjectingMCPClient(MCPClient):
         read_timeout_seconds: timedelta | None = None,
     ) -> Any:
         """Override to inject access_token for calendar tools."""
-        from strands.tools.mcp.mcp_types import MCPToolResult
-
         # Check if this is a calendar tool that needs access_token
-        if name.startswith("calendar___") and arguments is not None:
+        if arguments is not None and name[:CALENDAR_TOOL_PREFIX_LEN] == CALENDAR_TOOL_PREFIX:
             try:
-                token = await _get_google_token()
+                # On a miss, hand the lookup to the token loop (its blocking Identity
+                # calls run in a worker thread) so concurrent tool calls on this loop
+                # keep making progress
+                token = _get_cached_google_token(_current_user_id.get())
+                if token is None:
+                    token = await asyncio.wrap_future(_submit_google_token_lookup())
                 arguments["access_token"] = token
             except AuthRequiredError as e:
-                return MCPToolResult(
-                    toolUseId=tool_use_id,
-                    content=[
-                        {
-                            "text": f"[認証が必要です] Google Calendar へのアクセスを許可してください: {e.auth_url}"
-                        }
-                    ],
-                    status="error",
-                )
-
-        return await super().call_tool_async(tool_use_id, name, arguments, read_timeout_seconds)
-
-
-# Initialize MCP client for AgentCore Gateway with auth injection
-mcp_client: AuthInjectingMCPClient | None = None
-if GATEWAY_ENDPOINT:
-    mcp_client = AuthInjectingMCPClient(
+                return _auth_required_result(tool_use_id, e.auth_url)
+
+        if name not in COALESCED_TOOLS:
+            return await super().call_tool_async(tool_use_id, name, arguments, read_timeout_seconds)
+
+        # Identical in-flight read calls (same user token and arguments) share one request
+        key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                super().call_tool_async(tool_use_id, name, arguments, read_timeout_seconds)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        result = await asyncio.shield(task)
+        return {**result, "toolUseId": tool_use_id}
+
+
+def _create_mcp_client() -> AuthInjectingMCPClient | None:
+    """Create the MCP client for AgentCore Gateway with auth injection."""
+    if not GATEWAY_ENDPOINT:
+        return None
+    return AuthInjectingMCPClient(
         lambda: cognito_auth_streamablehttp_client(GATEWAY_ENDPOINT),
+        tool_catalog_path=_tool_catalog_path(GATEWAY_ENDPOINT, MCP_TOOLS_VERSION),
     )
 
+
+# Initialize MCP client for AgentCore Gateway (replaced if its session drops)
+mcp_client = _create_mcp_client()
+
 # System prompt template for the agent
 SYSTEM_PROMPT_TEMPLATE = """あなたは Mynion というSlackアシスタントです。ユーザーの質問に日本語で答えてください。
 
 現在の日時: {current_datetime} (日本時間)
 
-重要: calendar___ で始まるツール（calendar___get_events, calendar___create_event など）を使う際、
-access_token パラメータは自動的に注入されます。ユーザーにトークンを求めないでください。
-カレンダー関連の質問には、直接ツールを呼び出して回答してください。
+カレンダー関連の質問には、calendar___ で始まるツールを直接呼び出して回答してください。
+互いに依存しない複数のカレンダー操作は、1回の応答でまとめて呼び出してください（並列に実行されます）。
 「今日」「明日」などの相対的な日付は、上記の現在日時を基準に YYYY-MM-DD 形式に変換してください。"""
 
 
+# Japan Standard Time, used for the current datetime in the system prompt
+JST = timezone(timedelta(hours=9))
+
+# Cache for the formatted system prompt: (minute since epoch, prompt)
+_prompt_cache: tuple[int, str] | None = None
+
+
 def _get_system_prompt() -> str:
-    """Generate system prompt with current datetime."""
-    jst = timezone(timedelta(hours=9))
-    now = datetime.now(jst)
+    """Generate system prompt with current datetime (cached per minute)."""
+    global _prompt_cache
+
+    now = datetime.now(JST)
+    minute = int(now.timestamp()) // 60
+    cached = _prompt_cache
+    if cached is not None and cached[0] == minute:
+        return cached[1]
+
     current_datetime = now.strftime("%Y年%m月%d日 %H:%M")
-    return SYSTEM_PROMPT_TEMPLATE.format(current_datetime=current_datetime)
+    prompt = SYSTEM_PROMPT_TEMPLATE.format(current_datetime=current_datetime)
+    _prompt_cache = (minute, prompt)
+    return prompt
 
 
 def _create_agent() -> Agent:
     """Create a new agent with current datetime in system prompt."""
     return Agent(
+        model=BedrockModel(model_id=BEDROCK_MODEL_ID),
         tools=[mcp_client] if mcp_client else [],
         system_prompt=_get_system_prompt(),
+        # Independent tool uses in one turn run concurrently via call_tool_async
+        tool_executor=ConcurrentToolExecutor(),
     )
 
 
+# Long-lived agent, reused across invocations so the MCP session and tool registry
+# are set up once per container (guarded by _agent_lock). The session outlives any
+# single Cognito token; CognitoBearerAuth picks up the current one per request.
+# _agent_lock is held for the whole agent call, so a container serves one
+# invocation at a time; concurrent ones queue on the lock.
+_agent: Agent | None = None
+_agent_lock = threading.Lock()
+
+
+def _get_agent() -> Agent:
+    """Get the shared agent with an up-to-date system prompt and empty history.
+
+    Must be called with _agent_lock held.
+    """
+    global _agent
+
+    if _agent is not None and mcp_client is not None and not mcp_client.is_session_active():
+        logger.warning("Gateway MCP session is no longer active, reconnecting")
+        _discard_agent()
+
+    if _agent is None:
+        _agent = _create_agent()
+        return _agent
+
+    system_prompt = _get_system_prompt()
+    if _agent.system_prompt != system_prompt:
+        _agent.system_prompt = system_prompt
+
+    # Each invocation is independent; do not carry over previous conversation
+    _agent.messages = []
+    return _agent
+
+
+def _discard_agent() -> None:
+    """Drop the shared agent and its MCP client so the next call reconnects.
+
+    MCPClient does not recover a dropped Gateway session (closed stream, dead
+    background thread), so the agent is rebuilt on a fresh client.
+    Must be called with _agent_lock held.
+    """
+    global _agent, mcp_client
+
+    stale, _agent = _agent, None
+    if stale is not None:
+        try:
+            stale.cleanup()
+        except Exception as e:
+            logger.warning(f"Failed to clean up the previous agent: {e}")
+    mcp_client = _create_mcp_client()
+
+
 # BedrockAgentCoreApp for handling runtime invocations
-app = BedrockAgentCoreApp()
+app = BedrockAgentCoreApp(lifespan=_lifespan)
+
+
+def _run_agent(user_message: str) -> AgentResult:
+    """Run the shared agent on one message (serialized across invocations)."""
+    with _agent_lock:
+        # Reuse the shared agent with current datetime in system prompt
+        agent = _get_agent()
+
+        # Let the LLM decide which tools to use
+        # Auth is handled transparently by AuthInjectingMCPClient
+        try:
+            return agent(user_message)
+        except (MCPClientInitializationError, ToolProviderException):
+            # The MCP session failed; reconnect on the next invocation
+            _discard_agent()
+            raise
 
 
 @app.entrypoint
@@ -297,19 +804,19 @@ async def agent_invocation(
         yield {"error": "No prompt found in payload", "status": "error"}
         return
 
-    # Extract user_id from payload for OAuth callback URL construction
+    # Extract user_id from payload for OAuth callback URL construction.
+    # It is set in a per-request context so the write never leaks past this call.
     user_id = payload.get("user_id")
+    request_context = contextvars.copy_context()
     if user_id:
-        _current_user_id.set(user_id)
+        request_context.run(_current_user_id.set, user_id)
         logger.info(f"Set current user_id: {user_id}")
 
     try:
-        # Create agent with current datetime in system prompt
-        agent = _create_agent()
-
-        # Let the LLM decide which tools to use
-        # Auth is handled transparently by AuthInjectingMCPClient
-        agent_result = agent(user_message)
+        # Run the blocking agent call in a worker thread so the event loop keeps
+        # serving /ping meanwhile. Invocations still run one at a time: each waits
+        # for _agent_lock in its own default-executor thread.
+        agent_result = await asyncio.to_thread(request_context.run, _run_agent, user_message)
         yield {"message": agent_result.message, "status": "success"}
     except Exception as e:
         logger.error(f"Agent invocation failed: {e}", exc_info=True)
@@ -317,9 +824,30 @@ async def agent_invocation(
             "error": "処理中にエラーが発生しました。しばらく経ってから再度お試しください。",
             "status": "error",
         }
-    finally:
-        # Clear user_id context after invocation
-        _current_user_id.set(None)
+
+
+def _warm_agent() -> None:
+    """Create the shared agent (MCP session + tool discovery) before the first request."""
+    try:
+        with _agent_lock:
+            if _agent is None:
+                _get_agent()
+        logger.info("Agent and MCP session warmed up")
+    except Exception as e:
+        logger.warning(f"Failed to warm up agent: {e}")
+
+
+def _warm_auth() -> None:
+    """Prefetch Cognito credentials and access token so the first request hits the cache."""
+    try:
+        get_cognito_access_token()
+        logger.info("Cognito access token prefetched")
+    except Exception as e:
+        logger.warning(f"Failed to prefetch Cognito access token: {e}")
+
+
+if WARM_AUTH:
+    _warm_auth()
 
 
 if __name__ == "__main__":
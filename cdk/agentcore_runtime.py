@@ -6,6 +6,13 @@ from aws_cdk import aws_iam as iam
 from constructs import Construct
 from gateway_stack import GatewayStack
 
+# Model the agent runs on (the Claude Sonnet 4 APAC cross-region inference profile);
+# overridable with the mynion:bedrockModelId context value
+DEFAULT_BEDROCK_MODEL_ID = "apac.anthropic.claude-sonnet-4-20250514-v1:0"
+
+# Model ID prefixes of cross-region inference profiles
+CROSS_REGION_INFERENCE_PREFIXES = frozenset({"apac", "au", "eu", "global", "jp", "us"})
+
 
 class AgentCoreStack(Stack):
     """Stack for deploying Mynion agent to AWS Bedrock AgentCore Runtime"""
@@ -53,7 +60,7 @@ class AgentCoreStack(Stack):
             )
         )
 
-        # CloudWatch Logs permissions
+        # CloudWatch Logs permissions (scoped to the AgentCore runtime log groups)
         execution_role.add_to_policy(
             iam.PolicyStatement(
                 actions=[
@@ -61,10 +68,18 @@ class AgentCoreStack(Stack):
                     "logs:CreateLogStream",
                     "logs:PutLogEvents",
                     "logs:DescribeLogStreams",
-                    "logs:DescribeLogGroups",
                 ],
                 resources=[
                     f"arn:aws:logs:{Stack.of(self).region}:{Stack.of(self).account}:log-group:/aws/bedrock-agentcore/runtimes/*",
+                ],
+            )
+        )
+
+        # DescribeLogGroups cannot be scoped to a log group prefix
+        execution_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["logs:DescribeLogGroups"],
+                resources=[
                     f"arn:aws:logs:{Stack.of(self).region}:{Stack.of(self).account}:log-group:*",
                 ],
             )
@@ -92,8 +107,23 @@ class AgentCoreStack(Stack):
             )
         )
 
-        # Grant permissions to invoke Bedrock models
-        # The Strands agent needs to call Bedrock foundation models
+        # Grant permissions to invoke the agent's Bedrock model (also passed to the
+        # runtime as BEDROCK_MODEL_ID). A cross-region inference profile (apac.* in
+        # ap-northeast-1) may route to the foundation model in any region of the
+        # profile, hence the region wildcard on the foundation-model ARN
+        bedrock_model_id: str = (
+            self.node.try_get_context("mynion:bedrockModelId") or DEFAULT_BEDROCK_MODEL_ID
+        )
+        model_prefix, _, foundation_model_id = bedrock_model_id.partition(".")
+        if model_prefix in CROSS_REGION_INFERENCE_PREFIXES:
+            bedrock_model_resources = [
+                f"arn:aws:bedrock:{Stack.of(self).region}:{Stack.of(self).account}:inference-profile/{bedrock_model_id}",
+                f"arn:aws:bedrock:*::foundation-model/{foundation_model_id}",
+            ]
+        else:
+            bedrock_model_resources = [
+                f"arn:aws:bedrock:{Stack.of(self).region}::foundation-model/{bedrock_model_id}"
+            ]
         execution_role.add_to_policy(
             iam.PolicyStatement(
                 sid="BedrockModelInvocation",
@@ -101,10 +131,7 @@ class AgentCoreStack(Stack):
                     "bedrock:InvokeModel",
                     "bedrock:InvokeModelWithResponseStream",
                 ],
-                resources=[
-                    "arn:aws:bedrock:*::foundation-model/*",
-                    f"arn:aws:bedrock:{Stack.of(self).region}:{Stack.of(self).account}:*",
-                ],
+                resources=bedrock_model_resources,
             )
         )
 
@@ -139,6 +166,18 @@ class AgentCoreStack(Stack):
             )
         )
 
+        # SecretCache (agent.py) calls DescribeSecret before GetSecretValue to track
+        # the current secret version of the Gateway Cognito credentials
+        execution_role.add_to_policy(
+            iam.PolicyStatement(
+                sid="SecretsManagerDescribe",
+                actions=["secretsmanager:DescribeSecret"],
+                resources=[
+                    f"arn:aws:secretsmanager:{Stack.of(self).region}:{Stack.of(self).account}:secret:mynion-gateway-cognito-*",
+                ],
+            )
+        )
+
         # Grant permissions to invoke AgentCore Gateway
         execution_role.add_to_policy(
             iam.PolicyStatement(
@@ -185,6 +224,11 @@ class AgentCoreStack(Stack):
                 "COGNITO_SECRET_NAME": gateway_stack.cognito_secret_name,
                 "GOOGLE_CREDENTIAL_PROVIDER": google_credential_provider,
                 "GOOGLE_OAUTH_CALLBACK_URL": google_oauth_callback_url,
+                "BEDROCK_MODEL_ID": bedrock_model_id,
+                # Prefetch Cognito credentials/token during container init
+                "MYNION_WARM_AUTH": "1",
+                # Resolve STS to the in-region endpoint if any SDK client needs it
+                "AWS_STS_REGIONAL_ENDPOINTS": "regional",
             },
         )
 
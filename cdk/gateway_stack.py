@@ -2,7 +2,7 @@
 AgentCore Gateway Stack for Calendar MCP tools.
 
 This stack creates:
-- Calendar Lambda function
+- Calendar Lambda function (Google API client dependencies in a layer)
 - Cognito User Pool for OAuth2 authentication
 - AgentCore Gateway with CUSTOM_JWT authorizer
 - Lambda Target with calendar tools
@@ -13,129 +13,103 @@ from pathlib import Path
 from aws_cdk import CfnOutput, Duration, RemovalPolicy, SecretValue, Stack
 from aws_cdk import aws_bedrockagentcore as agentcore
 from aws_cdk import aws_cognito as cognito
+from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as events_targets
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as lambda_
 from aws_cdk import aws_logs as logs
 from aws_cdk import aws_secretsmanager as secretsmanager
 from constructs import Construct
 
-
-def _create_tool_definitions() -> list[agentcore.CfnGatewayTarget.ToolDefinitionProperty]:
-    """Create tool definitions for the calendar Lambda target."""
-    return [
-        agentcore.CfnGatewayTarget.ToolDefinitionProperty(
-            name="get_events",
-            description="Get calendar events for a specified date range",
-            input_schema=agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                type="object",
-                properties={
-                    "access_token": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Google OAuth2 access token",
-                    ),
-                    "start_date": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Start date in YYYY-MM-DD format",
-                    ),
-                    "end_date": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="End date in YYYY-MM-DD format (optional)",
-                    ),
-                },
-                required=["access_token", "start_date"],
-            ),
-        ),
-        agentcore.CfnGatewayTarget.ToolDefinitionProperty(
-            name="create_event",
-            description="Create a new calendar event",
-            input_schema=agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                type="object",
-                properties={
-                    "access_token": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Google OAuth2 access token",
-                    ),
-                    "title": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Event title",
-                    ),
-                    "start_time": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Start time in ISO 8601 format",
-                    ),
-                    "end_time": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="End time in ISO 8601 format (optional)",
-                    ),
-                    "description": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Event description (optional)",
-                    ),
-                    "location": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Event location (optional)",
-                    ),
-                },
-                required=["access_token", "title", "start_time"],
-            ),
-        ),
-        agentcore.CfnGatewayTarget.ToolDefinitionProperty(
-            name="update_event",
-            description="Update an existing calendar event",
-            input_schema=agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                type="object",
-                properties={
-                    "access_token": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Google OAuth2 access token",
-                    ),
-                    "event_id": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="ID of the event to update",
-                    ),
-                    "title": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="New event title (optional)",
-                    ),
-                    "start_time": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="New start time in ISO 8601 format (optional)",
-                    ),
-                    "end_time": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="New end time in ISO 8601 format (optional)",
-                    ),
-                    "description": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="New event description (optional)",
-                    ),
-                    "location": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="New event location (optional)",
-                    ),
-                },
-                required=["access_token", "event_id"],
-            ),
-        ),
-        agentcore.CfnGatewayTarget.ToolDefinitionProperty(
-            name="delete_event",
-            description="Delete a calendar event",
-            input_schema=agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                type="object",
-                properties={
-                    "access_token": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="Google OAuth2 access token",
-                    ),
-                    "event_id": agentcore.CfnGatewayTarget.SchemaDefinitionProperty(
-                        type="string",
-                        description="ID of the event to delete",
-                    ),
-                },
-                required=["access_token", "event_id"],
-            ),
-        ),
+# Bundling command for the calendar dependencies layer (Lambda adds /opt/python to
+# sys.path). Installs dependencies, then prunes files never read at runtime (test/doc
+# trees, the ~500 discovery documents other than Calendar's) and strips debug symbols
+# from native extensions. Compiled .pyc files and *.dist-info are kept: /opt is
+# read-only, so without .pyc every cold start would recompile the sources, and
+# dist-info backs importlib.metadata lookups.
+CALENDAR_DEPS_BUNDLING_COMMAND = " && ".join(
+    [
+        "pip install -r requirements.txt -t /asset-output/python",
+        "find /asset-output/python -depth -type d"
+        " \\( -name tests -o -name docs -o -name examples \\) -exec rm -rf {} +",
+        "find /asset-output/python/googleapiclient/discovery_cache/documents"
+        " -name '*.json' ! -name 'calendar.v3.json' -delete",
+        "(find /asset-output/python -name '*.so' -exec strip --strip-unneeded {} + || true)",
     ]
+)
+
+
+def _string_property(description: str) -> dict[str, str]:
+    """Create a string property for a tool input schema."""
+    return {"Type": "string", "Description": description}
+
+
+# Shared by every tool
+_ACCESS_TOKEN_PROPERTY = _string_property("Google OAuth2 access token")
+
+# Tool definitions for the calendar Lambda target, in CloudFormation property form.
+# Applied to the target with a property override so synth serializes one dict instead
+# of building ~30 nested CfnGatewayTarget property objects through JSII.
+CALENDAR_TOOL_SCHEMA: list[dict] = [
+    {
+        "Name": "get_events",
+        "Description": "Get calendar events for a specified date range",
+        "InputSchema": {
+            "Type": "object",
+            "Properties": {
+                "access_token": _ACCESS_TOKEN_PROPERTY,
+                "start_date": _string_property("Start date in YYYY-MM-DD format"),
+                "end_date": _string_property("End date in YYYY-MM-DD format (optional)"),
+            },
+            "Required": ["access_token", "start_date"],
+        },
+    },
+    {
+        "Name": "create_event",
+        "Description": "Create a new calendar event",
+        "InputSchema": {
+            "Type": "object",
+            "Properties": {
+                "access_token": _ACCESS_TOKEN_PROPERTY,
+                "title": _string_property("Event title"),
+                "start_time": _string_property("Start time in ISO 8601 format"),
+                "end_time": _string_property("End time in ISO 8601 format (optional)"),
+                "description": _string_property("Event description (optional)"),
+                "location": _string_property("Event location (optional)"),
+            },
+            "Required": ["access_token", "title", "start_time"],
+        },
+    },
+    {
+        "Name": "update_event",
+        "Description": "Update an existing calendar event",
+        "InputSchema": {
+            "Type": "object",
+            "Properties": {
+                "access_token": _ACCESS_TOKEN_PROPERTY,
+                "event_id": _string_property("ID of the event to update"),
+                "title": _string_property("New event title (optional)"),
+                "start_time": _string_property("New start time in ISO 8601 format (optional)"),
+                "end_time": _string_property("New end time in ISO 8601 format (optional)"),
+                "description": _string_property("New event description (optional)"),
+                "location": _string_property("New event location (optional)"),
+            },
+            "Required": ["access_token", "event_id"],
+        },
+    },
+    {
+        "Name": "delete_event",
+        "Description": "Delete a calendar event",
+        "InputSchema": {
+            "Type": "object",
+            "Properties": {
+                "access_token": _ACCESS_TOKEN_PROPERTY,
+                "event_id": _string_property("ID of the event to delete"),
+            },
+            "Required": ["access_token", "event_id"],
+        },
+    },
+]
 
 
 class GatewayStack(Stack):
@@ -147,32 +121,136 @@ class GatewayStack(Stack):
         # Path to calendar Lambda code
         calendar_lambda_path = Path(__file__).parent.parent / "mcp" / "calendar"
 
-        # Create Calendar Lambda function
-        calendar_lambda = lambda_.Function(
+        # Calendar Lambda sizing (CDK context). Provisioned concurrency defaults to 0
+        # (off) so non-prod environments rely on SnapStart alone; Lambda does not
+        # allow SnapStart and provisioned concurrency on the same version.
+        calendar_provisioned_concurrency = int(
+            self.node.try_get_context("mynion:calendarProvisionedConcurrency") or 0
+        )
+        calendar_provisioned_concurrency_max = int(
+            self.node.try_get_context("mynion:calendarProvisionedConcurrencyMax") or 5
+        )
+        # 1024 MB buys a larger vCPU share for the TLS handshake and client setup to
+        # googleapis.com; re-tune with AWS Lambda Power Tuning on real get_events calls
+        calendar_memory_size = int(self.node.try_get_context("mynion:calendarMemorySize") or 1024)
+        # Scheduled warmer keeping a calendar execution environment alive (off by default;
+        # a cheaper alternative to provisioned concurrency for low-traffic periods)
+        calendar_warmer_enabled = bool(self.node.try_get_context("mynion:calendarWarmer"))
+        # Timeout and reserved concurrency bound how many invocations can pile
+        # up (and how much account concurrency they take) while the Google API is slow.
+        # Reserved concurrency defaults to 0 (off): Lambda keeps at least 100 unreserved
+        # executions per account, so reserving fails on accounts with low limits.
+        calendar_timeout_seconds = int(
+            self.node.try_get_context("mynion:calendarTimeoutSeconds") or 30
+        )
+        calendar_reserved_concurrency = int(
+            self.node.try_get_context("mynion:calendarReservedConcurrency") or 0
+        )
+        if calendar_provisioned_concurrency:
+            calendar_provisioned_concurrency_max = max(
+                calendar_provisioned_concurrency, calendar_provisioned_concurrency_max
+            )
+            if 0 < calendar_reserved_concurrency < calendar_provisioned_concurrency_max:
+                raise ValueError(
+                    "mynion:calendarReservedConcurrency must be at least the provisioned "
+                    f"concurrency maximum ({calendar_provisioned_concurrency_max})."
+                )
+
+        # Create layer with the Google API client dependencies (rebuilt only when
+        # requirements.txt changes, so handler-only deploys upload just the handler)
+        calendar_deps_layer = lambda_.LayerVersion(
             self,
-            "CalendarLambda",
-            function_name="mynion-calendar-mcp",
-            runtime=lambda_.Runtime.PYTHON_3_12,
-            handler="handler.handler",
+            "CalendarDepsLayer",
             code=lambda_.Code.from_asset(
                 str(calendar_lambda_path),
+                exclude=["*", "!requirements.txt"],
                 bundling={
                     "image": lambda_.Runtime.PYTHON_3_12.bundling_image,
+                    # Resolve arm64 wheels (e.g. orjson) to match the Graviton runtime
+                    "platform": "linux/arm64",
                     "command": [
                         "bash",
                         "-c",
-                        "pip install -r requirements.txt -t /asset-output && cp -r . /asset-output",
+                        CALENDAR_DEPS_BUNDLING_COMMAND,
                     ],
                 },
             ),
-            timeout=Duration.seconds(30),
-            memory_size=256,
+            compatible_runtimes=[lambda_.Runtime.PYTHON_3_12],
+            compatible_architectures=[lambda_.Architecture.ARM_64],
+            description="Google API client dependencies for the Calendar MCP Lambda",
+        )
+
+        # Create CloudWatch Log Group for Calendar Lambda
+        calendar_log_group = logs.LogGroup(
+            self,
+            "CalendarLambdaLogGroup",
+            retention=logs.RetentionDays.ONE_WEEK,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        # Create Calendar Lambda function
+        calendar_lambda = lambda_.Function(
+            self,
+            "CalendarLambda",
+            function_name="mynion-calendar-mcp",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            handler="handler.handler",
+            code=lambda_.Code.from_asset(
+                str(calendar_lambda_path),
+                exclude=["requirements.txt", "__pycache__"],
+            ),
+            layers=[calendar_deps_layer],
+            # Restore published versions from a post-init snapshot (module-level
+            # imports and the parsed Calendar discovery document) instead of cold INIT
+            snap_start=(
+                None
+                if calendar_provisioned_concurrency
+                else lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS
+            ),
+            timeout=Duration.seconds(calendar_timeout_seconds),
+            memory_size=calendar_memory_size,
+            reserved_concurrent_executions=calendar_reserved_concurrency or None,
             description="Calendar MCP Lambda for Google Calendar operations",
-            log_retention=logs.RetentionDays.ONE_WEEK,
+            log_group=calendar_log_group,
+            # Structured logs keep Logs Insights queries on fields instead of text parsing
+            logging_format=lambda_.LoggingFormat.JSON,
+            application_log_level_v2=lambda_.ApplicationLogLevel.INFO,
+            system_log_level_v2=lambda_.SystemLogLevel.WARN,
         )
 
+        # SnapStart and provisioned concurrency only apply to published versions, so
+        # the Gateway invokes the "live" alias of the current version (republished
+        # whenever the function configuration or code changes)
+        calendar_alias = lambda_.Alias(
+            self,
+            "CalendarLambdaLiveAlias",
+            alias_name="live",
+            version=calendar_lambda.current_version,
+            provisioned_concurrent_executions=calendar_provisioned_concurrency or None,
+        )
+        if calendar_provisioned_concurrency:
+            calendar_alias.add_auto_scaling(
+                min_capacity=calendar_provisioned_concurrency,
+                max_capacity=calendar_provisioned_concurrency_max,
+            ).scale_on_utilization(utilization_target=0.7)
+
+        if calendar_warmer_enabled:
+            events.Rule(
+                self,
+                "CalendarWarmer",
+                schedule=events.Schedule.rate(Duration.minutes(5)),
+                targets=[
+                    events_targets.LambdaFunction(
+                        calendar_alias,
+                        event=events.RuleTargetInput.from_object({"warmer": True}),
+                    )
+                ],
+                description="Keep a Calendar MCP Lambda execution environment warm",
+            )
+
         # Grant Lambda permission to be invoked by AgentCore Gateway
-        calendar_lambda.add_permission(
+        calendar_alias.add_permission(
             "AgentCoreGatewayInvoke",
             principal=iam.ServicePrincipal("bedrock-agentcore.amazonaws.com"),
             action="lambda:InvokeFunction",
@@ -191,7 +269,7 @@ class GatewayStack(Stack):
         gateway_service_role.add_to_policy(
             iam.PolicyStatement(
                 actions=["lambda:InvokeFunction"],
-                resources=[calendar_lambda.function_arn],
+                resources=[calendar_alias.function_arn],
             )
         )
 
@@ -287,15 +365,19 @@ class GatewayStack(Stack):
             target_configuration=agentcore.CfnGatewayTarget.TargetConfigurationProperty(
                 mcp=agentcore.CfnGatewayTarget.McpTargetConfigurationProperty(
                     lambda_=agentcore.CfnGatewayTarget.McpLambdaTargetConfigurationProperty(
-                        lambda_arn=calendar_lambda.function_arn,
+                        lambda_arn=calendar_alias.function_arn,
+                        # Populated by the InlinePayload override below
                         tool_schema=agentcore.CfnGatewayTarget.ToolSchemaProperty(
-                            inline_payload=_create_tool_definitions(),
+                            inline_payload=[],
                         ),
                     ),
                 ),
             ),
             description="Calendar Lambda Target for Google Calendar operations",
         )
+        gateway_target.add_property_override(
+            "TargetConfiguration.Mcp.Lambda.ToolSchema.InlinePayload", CALENDAR_TOOL_SCHEMA
+        )
         gateway_target.node.add_dependency(gateway)
 
         # Store references
@@ -7,7 +7,6 @@ then asynchronously invokes the Worker Lambda for actual processing.
 
 import hashlib
 import hmac
-import json
 import logging
 import os
 import time
@@ -15,11 +14,27 @@ from typing import Any
 
 import boto3
 import httpx
+import orjson
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# HTTP client for Slack API calls, shared across invocations so warm containers
+# reuse the TLS connection to slack.com (owned by the container, never closed)
+_http_client = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+)
+
+# Lightweight Slack endpoint used to open the connection during Lambda init
+SLACK_API_TEST_URL = "https://slack.com/api/api.test"
+
+# Static response bodies (rendered once; Lambda proxy bodies must be str)
+OK_BODY = orjson.dumps({"ok": True}).decode()
+INVALID_SIGNATURE_BODY = orjson.dumps({"error": "Invalid signature"}).decode()
+
 # AWS clients (lazy initialized)
 _lambda_client = None
 _secretsmanager_client = None
@@ -45,12 +60,32 @@ def get_secretsmanager_client():
 SLACK_SECRET_ARN = os.environ.get("SLACK_SECRET_ARN", "")
 WORKER_LAMBDA_ARN = os.environ.get("WORKER_LAMBDA_ARN", "")
 
+
+def warm_slack_connection() -> None:
+    """Open the TLS connection to slack.com so the first Slack API call reuses it."""
+    try:
+        _http_client.get(SLACK_API_TEST_URL, timeout=2.0)
+    except Exception as e:
+        logger.warning(f"Failed to warm Slack connection: {e}")
+
+
+# Create AWS clients and open the Slack connection during Lambda init so that work
+# stays out of the first request's 3 second budget (skipped outside Lambda, e.g. in tests)
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    get_lambda_client()
+    get_secretsmanager_client()
+    warm_slack_connection()
+
 # Cache for Slack credentials (loaded once per container lifecycle)
 _slack_credentials: dict[str, str] | None = None
 
 # Cache for bot user ID (loaded once per container lifecycle)
 _bot_user_id: str | None = None
 
+# Cache for the HMAC keyed with the signing secret (copied per request)
+_slack_signer: hmac.HMAC | None = None
+_slack_signer_secret: str | None = None
+
 
 def get_slack_credentials() -> dict[str, str]:
     """
@@ -69,7 +104,7 @@ def get_slack_credentials() -> dict[str, str]:
         logger.info(f"Loading Slack credentials from Secrets Manager: {SLACK_SECRET_ARN}")
         response = get_secretsmanager_client().get_secret_value(SecretId=SLACK_SECRET_ARN)
         secret_string = response.get("SecretString", "{}")
-        credentials: dict[str, str] = json.loads(secret_string)
+        credentials: dict[str, str] = orjson.loads(secret_string)
         _slack_credentials = credentials
         logger.info("Slack credentials loaded successfully")
         return credentials
@@ -109,33 +144,32 @@ class SlackClient:
             return _bot_user_id
 
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    f"{self.base_url}/auth.test",
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=10.0,
-                )
-
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-
-                if not result.get("ok"):
-                    error_msg = f"Slack API error: {result.get('error')}"
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg)
-
-                user_id: str = result.get("user_id", "")
-                if not user_id:
-                    error_msg = "Slack API response missing user_id"
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg)
-
-                # Cache successful result
-                _bot_user_id = user_id
-                return user_id
+            response = _http_client.post(
+                f"{self.base_url}/auth.test",
+                headers={
+                    "Authorization": f"Bearer {self.bot_token}",
+                    "Content-Type": "application/json",
+                },
+                timeout=10.0,
+            )
+
+            response.raise_for_status()
+            result: dict[str, Any] = response.json()
+
+            if not result.get("ok"):
+                error_msg = f"Slack API error: {result.get('error')}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+
+            user_id: str = result.get("user_id", "")
+            if not user_id:
+                error_msg = "Slack API response missing user_id"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+
+            # Cache successful result
+            _bot_user_id = user_id
+            return user_id
 
         except RuntimeError:
             raise
@@ -160,28 +194,27 @@ class SlackClient:
             Returns {"messages": []} on error to allow graceful degradation.
         """
         try:
-            with httpx.Client() as client:
-                response = client.get(
-                    f"{self.base_url}/conversations.replies",
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                    },
-                    params={
-                        "channel": channel,
-                        "ts": thread_ts,
-                        "limit": 5,
-                    },
-                    timeout=10.0,
-                )
-
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-
-                if not result.get("ok"):
-                    logger.error(f"Slack API error: {result.get('error')}")
-                    return {"messages": []}
-
-                return result
+            response = _http_client.get(
+                f"{self.base_url}/conversations.replies",
+                headers={
+                    "Authorization": f"Bearer {self.bot_token}",
+                },
+                params={
+                    "channel": channel,
+                    "ts": thread_ts,
+                    "limit": 5,
+                },
+                timeout=10.0,
+            )
+
+            response.raise_for_status()
+            result: dict[str, Any] = response.json()
+
+            if not result.get("ok"):
+                logger.error(f"Slack API error: {result.get('error')}")
+                return {"messages": []}
+
+            return result
 
         except Exception as e:
             logger.error(f"Error getting thread replies: {str(e)}", exc_info=True)
@@ -255,12 +288,33 @@ def should_respond(
     return bool(thread_ts and is_bot_in_thread(slack_client, channel, thread_ts, bot_user_id))
 
 
-def verify_slack_request(event: dict[str, Any]) -> bool:
+def get_slack_signer(signing_secret: str) -> hmac.HMAC:
+    """
+    Get an HMAC-SHA256 object keyed with the Slack signing secret.
+    Cached for container lifecycle; callers must copy() before update().
+
+    Args:
+        signing_secret: Slack signing secret
+
+    Returns:
+        Keyed HMAC object with no message data
+    """
+    global _slack_signer, _slack_signer_secret
+
+    if _slack_signer is None or _slack_signer_secret != signing_secret:
+        _slack_signer = hmac.new(signing_secret.encode(), digestmod=hashlib.sha256)
+        _slack_signer_secret = signing_secret
+
+    return _slack_signer
+
+
+def verify_slack_request(event: dict[str, Any], raw_body: str | None = None) -> bool:
     """
     Verify that the request came from Slack using the signing secret.
 
     Args:
         event: Lambda event containing headers and body
+        raw_body: Raw request body already read from the event (read from event if None)
 
     Returns:
         True if the request is valid, False otherwise
@@ -289,18 +343,14 @@ def verify_slack_request(event: dict[str, Any]) -> bool:
             return False
 
         # Get request body
-        body = event.get("body", "")
+        if raw_body is None:
+            raw_body = event.get("body") or ""
 
         # Compute the signature
-        sig_basestring = f"v0:{slack_request_timestamp}:{body}"
-        computed_signature = (
-            "v0="
-            + hmac.new(
-                signing_secret.encode(),
-                sig_basestring.encode(),
-                hashlib.sha256,
-            ).hexdigest()
-        )
+        sig_basestring = f"v0:{slack_request_timestamp}:{raw_body}"
+        signer = get_slack_signer(signing_secret).copy()
+        signer.update(sig_basestring.encode())
+        computed_signature = "v0=" + signer.hexdigest()
 
         # Compare signatures
         if not hmac.compare_digest(computed_signature, slack_signature):
@@ -332,20 +382,40 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         API Gateway response (200 OK)
     """
     try:
-        logger.info(f"Received event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received event: {orjson.dumps(event).decode()}")
+
+        # Read the body once: the raw string is signed as-is, then parsed
+        body = event.get("body") or ""
+        # Non-proxy integration delivers the body pre-parsed
+        raw_body = orjson.dumps(body).decode() if isinstance(body, dict) else body
 
         # Verify Slack signature
-        if not verify_slack_request(event):
+        if not verify_slack_request(event, raw_body):
             logger.error("Invalid Slack signature")
             return {
                 "statusCode": 401,
-                "body": json.dumps({"error": "Invalid signature"}),
+                "body": INVALID_SIGNATURE_BODY,
+            }
+
+        # Slack retries deliveries it thinks timed out (e.g. during a cold start);
+        # the original delivery still reached the worker, so ack those retries.
+        # Retries after an error response (http_error etc.) may never have been
+        # handed to the worker, so they are processed normally.
+        headers = event.get("headers") or {}
+        retry_num = headers.get("X-Slack-Retry-Num")
+        retry_reason = headers.get("X-Slack-Retry-Reason")
+        if retry_num and retry_reason == "http_timeout":
+            logger.info(f"Skipping Slack retry delivery: retry_num={retry_num}")
+            return {
+                "statusCode": 200,
+                "headers": {"Content-Type": "application/json"},
+                "body": OK_BODY,
             }
 
         # Parse request body
-        body = event.get("body", "{}")
-        if isinstance(body, str):
-            body = json.loads(body)
+        if not isinstance(body, dict):
+            body = orjson.loads(raw_body) if raw_body else {}
 
         event_type = body.get("type")
 
@@ -355,7 +425,7 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             return {
                 "statusCode": 200,
                 "headers": {"Content-Type": "application/json"},
-                "body": json.dumps({"challenge": body.get("challenge")}),
+                "body": orjson.dumps({"challenge": body.get("challenge")}).decode(),
             }
 
         # Handle event callback
@@ -370,7 +440,7 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
                 return {
                     "statusCode": 200,
                     "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps({"ok": True}),
+                    "body": OK_BODY,
                 }
 
             # Get Slack credentials for bot user ID check
@@ -382,7 +452,7 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
                 return {
                     "statusCode": 200,
                     "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps({"ok": True}),
+                    "body": OK_BODY,
                 }
 
             # Check if bot should respond to this event
@@ -394,7 +464,7 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
                 return {
                     "statusCode": 200,
                     "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps({"ok": True}),
+                    "body": OK_BODY,
                 }
 
             if not should_respond(slack_client, slack_event, bot_user_id):
@@ -402,7 +472,7 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
                 return {
                     "statusCode": 200,
                     "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps({"ok": True}),
+                    "body": OK_BODY,
                 }
 
             # Extract user and team IDs for identity
@@ -426,25 +496,27 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             }
 
             # Invoke Worker Lambda asynchronously (fire and forget)
-            logger.info(f"Invoking Worker Lambda with payload: {worker_payload}")
+            logger.info(
+                f"Invoking Worker Lambda: event_id={worker_payload['event_id']}, thread_id={thread_id}"
+            )
             get_lambda_client().invoke(
                 FunctionName=WORKER_LAMBDA_ARN,
                 InvocationType="Event",  # Asynchronous invocation
-                Payload=json.dumps(worker_payload),
+                Payload=orjson.dumps(worker_payload),
             )
 
             # Return 200 OK immediately
             return {
                 "statusCode": 200,
                 "headers": {"Content-Type": "application/json"},
-                "body": json.dumps({"ok": True}),
+                "body": OK_BODY,
             }
 
         # Unknown event type
         logger.warning(f"Unknown event type: {event_type}")
         return {
             "statusCode": 200,
-            "body": json.dumps({"ok": True}),
+            "body": OK_BODY,
         }
 
     except Exception as e:
@@ -452,5 +524,5 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         # Still return 200 to Slack to avoid retries
         return {
             "statusCode": 200,
-            "body": json.dumps({"ok": True}),
+            "body": OK_BODY,
         }
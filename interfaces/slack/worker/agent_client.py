@@ -5,15 +5,49 @@ Uses bedrock-agentcore service to invoke AgentCore Runtime endpoints.
 Handles streaming responses and session management.
 """
 
-import json
+import io
 import logging
+import threading
 from typing import Any
 
-import boto3
+import botocore.session
+import orjson
 from botocore.config import Config
 
 logger = logging.getLogger()
 
+# boto3 client settings for AgentCore Runtime invocations (long-running streams)
+CLIENT_CONFIG = Config(
+    read_timeout=300,
+    connect_timeout=10,
+    tcp_keepalive=True,
+    retries={"max_attempts": 2, "mode": "standard"},
+)
+
+# Read size for the SSE response body (the full response is collected before use)
+STREAM_CHUNK_SIZE = 8192
+
+# botocore session shared by the worker's AWS clients (one service model loader);
+# botocore is used directly to skip importing boto3's resource layer at cold start
+boto_session = botocore.session.get_session()
+
+# bedrock-agentcore clients shared across AgentCoreClient instances, keyed by region
+# (reused for the warm container lifecycle)
+_client_cache: dict[str, Any] = {}
+_client_cache_lock = threading.Lock()
+
+
+def get_boto3_client(region: str) -> Any:
+    """Get the shared bedrock-agentcore client for a region (thread-safe)."""
+    with _client_cache_lock:
+        client = _client_cache.get(region)
+        if client is None:
+            client = boto_session.create_client(
+                "bedrock-agentcore", region_name=region, config=CLIENT_CONFIG
+            )
+            _client_cache[region] = client
+        return client
+
 
 class AgentCoreClient:
     """Client for interacting with AgentCore Runtime via boto3."""
@@ -28,18 +62,7 @@ class AgentCoreClient:
         """
         self.endpoint_arn = endpoint_arn
         self.region = region
-
-        config = Config(
-            read_timeout=300,
-            connect_timeout=10,
-            retries={"max_attempts": 2, "mode": "standard"},
-        )
-
-        self.client = boto3.client(
-            "bedrock-agentcore",
-            region_name=region,
-            config=config,
-        )
+        self.client = get_boto3_client(region)
 
     def invoke_agent(self, user_id: str, session_id: str, input_text: str) -> str:
         """
@@ -60,7 +83,7 @@ class AgentCoreClient:
             # 1. payload: for agent.py to build OAuth callback URL
             #    (runtimeUserId is NOT passed to agent via SDK headers)
             # 2. runtimeUserId: for AgentCore session binding (CompleteResourceTokenAuth)
-            payload = json.dumps({"prompt": input_text, "user_id": user_id}).encode()
+            payload = orjson.dumps({"prompt": input_text, "user_id": user_id})
 
             response = self.client.invoke_agent_runtime(
                 agentRuntimeArn=self.endpoint_arn,
@@ -110,32 +133,43 @@ class AgentCoreClient:
             logger.info(f"Response content type: {content_type}")
 
             if "text/event-stream" in content_type:
-                content = []
-                for line in response["response"].iter_lines(chunk_size=10):
+                # Newline-joined data payloads, built in one buffer
+                buf = io.StringIO()
+                last: str | None = None
+                chunk_count = 0
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for line in response["response"].iter_lines(chunk_size=STREAM_CHUNK_SIZE):
                     if line:
                         line_str = line.decode("utf-8")
                         if line_str.startswith("data: "):
                             data = line_str[6:]
-                            content.append(data)
-                            logger.debug(f"Received chunk: {data}")
-
-                if not content:
+                            if last is not None:
+                                buf.write("\n")
+                            buf.write(data)
+                            last = data
+                            chunk_count += 1
+                            if debug:
+                                logger.debug(f"Received chunk: {data}")
+
+                if last is None:
                     return "応答がありませんでした。"
 
-                logger.info(f"Complete response received: {len(content)} chunks")
+                logger.info(f"Complete response received: {chunk_count} chunks")
 
-                try:
-                    last_chunk = json.loads(content[-1])
-                    return self._extract_text(last_chunk)
-                except (json.JSONDecodeError, IndexError, TypeError) as e:
-                    logger.warning(f"Failed to parse streaming response as JSON: {e}")
-                    return "\n".join(content)
+                # Only the final JSON object carries the message; skip the decode
+                # attempt (and its exception path) for plain-text streams
+                if last.startswith("{"):
+                    try:
+                        return self._extract_text(orjson.loads(last))
+                    except (orjson.JSONDecodeError, TypeError) as e:
+                        logger.warning(f"Failed to parse streaming response as JSON: {e}")
+                return buf.getvalue()
 
             elif content_type == "application/json":
-                content = []
-                for chunk in response.get("response", []):
-                    content.append(chunk.decode("utf-8"))
-                parsed: dict[str, Any] = json.loads("".join(content))
+                # Decode once after joining so multi-byte characters split across
+                # chunks stay intact
+                body = b"".join(response.get("response", []))
+                parsed: dict[str, Any] = orjson.loads(body)
                 return self._extract_text(parsed)
 
             else:
@@ -8,24 +8,54 @@ This function:
 4. Sends responses back to Slack
 """
 
-import json
 import logging
 import os
 import re
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
-import boto3
-import httpx
+import orjson
+import urllib3
+from botocore.config import Config
 
-from .agent_client import AgentCoreClient
+from .agent_client import AgentCoreClient, boto_session
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# HTTP connection pool for Slack API calls, shared across invocations so warm
+# containers reuse the TLS connection to slack.com. urllib3 already ships with
+# botocore, so this avoids importing httpx during cold start.
+_http_pool = urllib3.PoolManager(
+    maxsize=4,
+    timeout=urllib3.Timeout(total=10.0),
+    retries=urllib3.Retry(total=2, backoff_factor=0.1),
+)
+
+# Lightweight Slack endpoint used to open the connection during Lambda init
+SLACK_API_TEST_URL = "https://slack.com/api/api.test"
+
+# Background thread for the "thinking" Slack post, so it overlaps the agent call
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slack")
+
+# Post the "thinking" message only if the agent has not answered within this delay
+THINKING_DELAY_SECONDS = 0.8
+
+# Secrets Manager client settings: keep the connection alive and fail fast
+SECRETS_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=4,
+    connect_timeout=1.0,
+    read_timeout=3.0,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
 # Initialize AWS clients
-secretsmanager_client = boto3.client("secretsmanager")
+secretsmanager_client = boto_session.create_client("secretsmanager", config=SECRETS_CLIENT_CONFIG)
 
 # Environment variables
 SLACK_SECRET_ARN = os.environ.get("SLACK_SECRET_ARN", "")
@@ -36,6 +66,9 @@ AWS_REGION = os.environ.get("AWS_REGION", "ap-northeast-1")
 # Slack session namespace for UUID v5 generation (fixed, never change)
 SLACK_SESSION_NAMESPACE = uuid.UUID("a1b2c3d4-e5f6-5678-9abc-def012345678")
 
+# Slack user mention markup (<@U123ABC>), stripped from incoming messages
+MENTION_PATTERN = re.compile(r"<@[A-Z0-9]+>")
+
 # Cache for Slack credentials
 _slack_credentials: dict[str, str] | None = None
 
@@ -57,18 +90,35 @@ def get_slack_credentials() -> dict[str, str]:
         logger.info("Loading Slack credentials from Secrets Manager")
         response = secretsmanager_client.get_secret_value(SecretId=SLACK_SECRET_ARN)
         secret_string = response.get("SecretString", "{}")
-        credentials: dict[str, str] = json.loads(secret_string)
+        credentials: dict[str, str] = orjson.loads(secret_string)
         _slack_credentials = credentials
         logger.info("Slack credentials loaded successfully")
         return credentials
     except Exception as e:
-        logger.error(f"Error loading Slack credentials: {str(e)}", exc_info=True)
+        logger.error("Error loading Slack credentials: %s", e, exc_info=True)
         # Fallback to environment variables for local testing
         return {
             "SLACK_BOT_TOKEN": os.environ.get("SLACK_BOT_TOKEN", ""),
         }
 
 
+def warm_slack_connection() -> None:
+    """Open the TLS connection to slack.com so the first Slack post reuses it."""
+    try:
+        _http_pool.request("GET", SLACK_API_TEST_URL, timeout=2.0, retries=False)
+    except Exception as e:
+        logger.warning("Failed to warm Slack connection: %s", e)
+
+
+# Load credentials, warm the Slack connection and build the AgentCore client during
+# Lambda init so the first Slack event skips those round-trips (retried lazily if
+# they fail)
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    get_slack_credentials()
+    warm_slack_connection()
+_agent_client = AgentCoreClient(endpoint_arn=AGENTCORE_RUNTIME_ENDPOINT, region=AWS_REGION)
+
+
 class SlackClient:
     """Client for Slack API interactions."""
 
@@ -76,6 +126,46 @@ class SlackClient:
         self.bot_token = bot_token
         self.base_url = "https://slack.com/api"
 
+    def _post_json(self, api_method: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        POST a JSON payload to a Slack Web API method.
+
+        Args:
+            api_method: Slack API method name (e.g. chat.postMessage)
+            payload: JSON request body
+
+        Returns:
+            Slack API response
+
+        Raises:
+            Exception: When the HTTP request fails or Slack returns ok=false
+        """
+        try:
+            response = _http_pool.request(
+                "POST",
+                f"{self.base_url}/{api_method}",
+                headers={
+                    "Authorization": f"Bearer {self.bot_token}",
+                    "Content-Type": "application/json",
+                },
+                body=orjson.dumps(payload),
+            )
+
+            if response.status >= 400:
+                raise Exception(f"Slack API HTTP error: {response.status}")
+
+            result: dict[str, Any] = orjson.loads(response.data)
+
+            if not result.get("ok"):
+                logger.error("Slack API error: %s", result.get("error"))
+                raise Exception(f"Slack API error: {result.get('error')}")
+
+            return result
+
+        except Exception as e:
+            logger.error("Error calling Slack %s: %s", api_method, e, exc_info=True)
+            raise
+
     def post_message(self, channel: str, text: str, thread_ts: str | None = None) -> dict[str, Any]:
         """
         Post a message to Slack channel.
@@ -88,38 +178,10 @@ class SlackClient:
         Returns:
             Slack API response
         """
-        try:
-            payload = {
-                "channel": channel,
-                "text": text,
-            }
-
-            if thread_ts:
-                payload["thread_ts"] = thread_ts
-
-            with httpx.Client() as client:
-                response = client.post(
-                    f"{self.base_url}/chat.postMessage",
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
-
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-
-                if not result.get("ok"):
-                    logger.error(f"Slack API error: {result.get('error')}")
-                    raise Exception(f"Slack API error: {result.get('error')}")
-
-                return result
-
-        except Exception as e:
-            logger.error(f"Error posting to Slack: {str(e)}", exc_info=True)
-            raise
+        payload = {"channel": channel, "text": text}
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+        return self._post_json("chat.postMessage", payload)
 
     def update_message(self, channel: str, ts: str, text: str) -> dict[str, Any]:
         """
@@ -133,36 +195,62 @@ class SlackClient:
         Returns:
             Slack API response
         """
-        try:
-            payload = {
-                "channel": channel,
-                "ts": ts,
-                "text": text,
-            }
-
-            with httpx.Client() as client:
-                response = client.post(
-                    f"{self.base_url}/chat.update",
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
-
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-
-                if not result.get("ok"):
-                    logger.error(f"Slack API error: {result.get('error')}")
-                    raise Exception(f"Slack API error: {result.get('error')}")
-
-                return result
+        return self._post_json("chat.update", {"channel": channel, "ts": ts, "text": text})
 
-        except Exception as e:
-            logger.error(f"Error updating Slack message: {str(e)}", exc_info=True)
-            raise
+
+def post_thinking_after_delay(
+    slack_client: SlackClient,
+    channel: str,
+    thread_ts: str | None,
+    answered: threading.Event,
+) -> dict[str, Any] | None:
+    """
+    Post the "thinking" message unless the agent answers within THINKING_DELAY_SECONDS.
+
+    Args:
+        slack_client: Slack client to post with
+        channel: Slack channel ID
+        thread_ts: Optional thread timestamp for threaded replies
+        answered: Set once the agent response is ready
+
+    Returns:
+        Slack API response for the posted message, or None if it was not needed
+    """
+    if answered.wait(THINKING_DELAY_SECONDS):
+        return None
+    return slack_client.post_message(channel=channel, text="考え中...", thread_ts=thread_ts)
+
+
+def wait_for_thinking_post(thinking_future: Future[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """
+    Wait for the delayed "thinking" post to finish.
+
+    Args:
+        thinking_future: Future returned for post_thinking_after_delay
+
+    Returns:
+        Slack API response for the posted message, or None if it was skipped or failed
+    """
+    try:
+        return thinking_future.result()
+    except Exception as e:
+        logger.warning("Failed to post thinking message: %s", e)
+        return None
+
+
+@lru_cache(maxsize=512)
+def session_id_for_thread(thread_id: str) -> str:
+    """
+    Get the AgentCore session ID for a Slack thread.
+    Cached for container lifecycle since messages in a thread repeat the same ID.
+
+    Args:
+        thread_id: Slack thread timestamp
+
+    Returns:
+        UUID v5 string (min 33 chars required by AgentCore)
+    """
+    return str(uuid.uuid5(SLACK_SESSION_NAMESPACE, thread_id))
 
 
 def clean_message(text: str) -> str:
@@ -176,8 +264,7 @@ def clean_message(text: str) -> str:
         Cleaned message
     """
     # Remove <@BOTID> mentions
-    cleaned = re.sub(r"<@[A-Z0-9]+>", "", text).strip()
-    return cleaned
+    return MENTION_PATTERN.sub("", text).strip()
 
 
 def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
@@ -198,18 +285,10 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         Processing result
     """
     try:
-        logger.info(f"Worker received event: {json.dumps(event)}")
-
-        # Get Slack credentials
-        credentials = get_slack_credentials()
-        slack_bot_token = credentials.get("SLACK_BOT_TOKEN", "")
-
-        if not slack_bot_token:
-            logger.error("SLACK_BOT_TOKEN not found in credentials")
-            return {"statusCode": 500, "body": "Missing Slack credentials"}
-
-        # Initialize Slack client
-        slack_client = SlackClient(slack_bot_token)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Worker received event: %s", orjson.dumps(event).decode())
+        else:
+            logger.info("Worker received event: event_id=%s", event.get("event_id", ""))
 
         # Extract event data
         slack_event = event.get("event", {})
@@ -222,53 +301,71 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         user_message = clean_message(slack_event.get("text", ""))
         thread_ts = slack_event.get("ts")  # Reply in thread
 
+        # Skip empty messages before any Slack or AWS work
         if not user_message:
             logger.warning("Empty user message, skipping")
             return {"statusCode": 200, "body": "Empty message"}
 
+        # Get Slack credentials
+        credentials = get_slack_credentials()
+        slack_bot_token = credentials.get("SLACK_BOT_TOKEN", "")
+
+        if not slack_bot_token:
+            logger.error("SLACK_BOT_TOKEN not found in credentials")
+            return {"statusCode": 500, "body": "Missing Slack credentials"}
+
+        # Initialize Slack client
+        slack_client = SlackClient(slack_bot_token)
+
         # Generate IDs for AgentCore
         agentcore_user_id = f"slack-{team_id}-{user_id}"
 
         # Generate session ID using UUID v5 (min 33 chars required by AgentCore)
-        session_id = str(uuid.uuid5(SLACK_SESSION_NAMESPACE, thread_id))
+        session_id = session_id_for_thread(thread_id)
 
-        logger.info(f"Invoking AgentCore: user_id={agentcore_user_id}, session_id={session_id}")
-
-        # Send "thinking" message first to provide immediate feedback
-        thinking_response = slack_client.post_message(
-            channel=channel_id,
-            text="考え中...",
-            thread_ts=thread_ts,
-        )
-        thinking_ts: str = thinking_response.get("ts", "")
+        logger.info("Invoking AgentCore: user_id=%s, session_id=%s", agentcore_user_id, session_id)
 
-        # Initialize AgentCore client
-        agent_client = AgentCoreClient(
-            endpoint_arn=AGENTCORE_RUNTIME_ENDPOINT,
-            region=AWS_REGION,
+        # Send "thinking" message for feedback if the agent takes a while
+        answered = threading.Event()
+        thinking_future = _executor.submit(
+            post_thinking_after_delay, slack_client, channel_id, thread_ts, answered
         )
 
-        # Invoke AgentCore Runtime
-        result = agent_client.invoke_agent(
-            user_id=agentcore_user_id,
-            session_id=session_id,
-            input_text=user_message,
-        )
+        try:
+            # Invoke AgentCore Runtime
+            result = _agent_client.invoke_agent(
+                user_id=agentcore_user_id,
+                session_id=session_id,
+                input_text=user_message,
+            )
+        finally:
+            # Cancel the pending "thinking" post (also when the agent call fails) and
+            # wait for one already in flight, so nothing is posted after we return
+            answered.set()
+            thinking_response = wait_for_thinking_post(thinking_future)
 
         # agent_client returns extracted text (always string)
         agent_response = result if result else "応答がありませんでした。"
-        logger.info(f"Agent response length: {len(agent_response)}")
-
-        # Update the "thinking" message with actual response
-        slack_client.update_message(
-            channel=channel_id,
-            ts=thinking_ts,
-            text=agent_response,
-        )
-
-        logger.info("Successfully updated response in Slack")
+        logger.info("Agent response length: %d", len(agent_response))
+
+        if thinking_response is None:
+            # Fast answer (or failed "thinking" post): post it in a single Slack call
+            slack_client.post_message(
+                channel=channel_id,
+                text=agent_response,
+                thread_ts=thread_ts,
+            )
+        else:
+            # Update the "thinking" message with actual response
+            slack_client.update_message(
+                channel=channel_id,
+                ts=thinking_response.get("ts", ""),
+                text=agent_response,
+            )
+
+        logger.info("Successfully sent response to Slack")
         return {"statusCode": 200, "body": "Success"}
 
     except Exception as e:
-        logger.error(f"Worker error: {str(e)}", exc_info=True)
+        logger.error("Worker error: %s", e, exc_info=True)
         return {"statusCode": 500, "body": f"Worker error: {str(e)}"}
@@ -0,0 +1,838 @@
+"""
+Unit tests for the Mynion agent auth helpers.
+
+Tests the Cognito credential/token caching in agent.py
+without calling AWS or Cognito.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+os.environ.setdefault("AGENTCORE_GATEWAY_ENDPOINT", "https://gateway.example.com/mcp")
+os.environ.setdefault("COGNITO_SECRET_NAME", "test-cognito-secret")
+os.environ.setdefault("GOOGLE_CREDENTIAL_PROVIDER", "test-google-provider")
+os.environ.setdefault("GOOGLE_OAUTH_CALLBACK_URL", "https://example.com/oauth/callback")
+
+import agent  # noqa: E402
+
+JST = timezone(timedelta(hours=9))
+
+OK_RESULT = {"toolUseId": "tool-1", "status": "success", "content": [{"text": "ok"}]}
+COGNITO_SECRET = (
+    '{"client_id": "cid", "client_secret": "csecret",'
+    ' "token_endpoint": "https://auth.example.com/oauth2/token", "scope": "gateway-api/invoke"}'
+)
+
+
+class TestGetCognitoCredentials:
+    """Tests for get_cognito_credentials() function."""
+
+    def test_reads_secret_from_cache(self):
+        """Credentials should be served from the shared SecretCache."""
+        with patch.object(agent, "_secret_cache") as mock_cache:
+            mock_cache.get_secret_string.return_value = COGNITO_SECRET
+
+            result = agent.get_cognito_credentials()
+
+        assert result["client_id"] == "cid"
+        assert result["token_endpoint"] == "https://auth.example.com/oauth2/token"
+        mock_cache.get_secret_string.assert_called_once_with("test-cognito-secret")
+
+
+class TestGetCognitoAccessToken:
+    """Tests for get_cognito_access_token() function."""
+
+    def setup_method(self):
+        agent._cognito_token_cache.clear()
+
+    def test_fetches_and_caches_token(self):
+        """Token should be fetched once and then served from cache."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"access_token": "tok-1", "expires_in": 3600}'
+
+        with (
+            patch.object(agent, "_secret_cache") as mock_cache,
+            patch.object(
+                agent._http_client, "post", new=AsyncMock(return_value=mock_response)
+            ) as mock_post,
+        ):
+            mock_cache.get_secret_string.return_value = COGNITO_SECRET
+
+            first = agent.get_cognito_access_token()
+            second = agent.get_cognito_access_token()
+
+        assert first == "tok-1"
+        assert second == "tok-1"
+        mock_post.assert_called_once()
+
+    def test_short_lived_token_is_cached(self):
+        """A 5 minute token should still be served from cache, not refetched per call."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"access_token": "tok-1", "expires_in": 300}'
+
+        with (
+            patch.object(agent, "_secret_cache") as mock_cache,
+            patch.object(
+                agent._http_client, "post", new=AsyncMock(return_value=mock_response)
+            ) as mock_post,
+        ):
+            mock_cache.get_secret_string.return_value = COGNITO_SECRET
+
+            agent.get_cognito_access_token()
+            agent.get_cognito_access_token()
+
+        mock_post.assert_called_once()
+        assert agent._cognito_token_cache["expires_at"] == pytest.approx(time.time() + 150, abs=5)
+
+    def test_force_refresh_bypasses_cache(self):
+        """force_refresh should fetch a new token even when the cached one is valid."""
+        first_response = MagicMock()
+        first_response.content = b'{"access_token": "tok-1", "expires_in": 3600}'
+        second_response = MagicMock()
+        second_response.content = b'{"access_token": "tok-2", "expires_in": 3600}'
+
+        with (
+            patch.object(agent, "_secret_cache") as mock_cache,
+            patch.object(
+                agent._http_client,
+                "post",
+                new=AsyncMock(side_effect=[first_response, second_response]),
+            ) as mock_post,
+        ):
+            mock_cache.get_secret_string.return_value = COGNITO_SECRET
+
+            agent.get_cognito_access_token()
+            refreshed = agent.get_cognito_access_token(force_refresh=True)
+
+        assert refreshed == "tok-2"
+        assert agent._cognito_token_cache["token"] == "tok-2"
+        assert mock_post.call_count == 2
+
+    def test_awaitable_from_caller_loop(self):
+        """The async accessor should be awaitable from an unrelated event loop."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"access_token": "tok-1", "expires_in": 3600}'
+
+        with (
+            patch.object(agent, "_secret_cache") as mock_cache,
+            patch.object(agent._http_client, "post", new=AsyncMock(return_value=mock_response)),
+        ):
+            mock_cache.get_secret_string.return_value = COGNITO_SECRET
+
+            token = asyncio.run(agent._get_cognito_access_token())
+
+        assert token == "tok-1"
+
+    def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent cache misses should trigger a single token request."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"access_token": "tok-1", "expires_in": 3600}'
+        started = threading.Event()
+
+        async def slow_post(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(0.2)
+            return mock_response
+
+        with (
+            patch.object(agent, "_secret_cache") as mock_cache,
+            patch.object(
+                agent._http_client, "post", new=AsyncMock(side_effect=slow_post)
+            ) as mock_post,
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            mock_cache.get_secret_string.return_value = COGNITO_SECRET
+
+            first = executor.submit(agent.get_cognito_access_token)
+            started.wait()
+            others = [executor.submit(agent.get_cognito_access_token) for _ in range(3)]
+            results = [first.result()] + [f.result() for f in others]
+
+        assert results == ["tok-1"] * 4
+        mock_post.assert_called_once()
+
+
+class TestCognitoBearerAuth:
+    """Tests for CognitoBearerAuth per-request Gateway authentication."""
+
+    def setup_method(self):
+        agent._cognito_token_cache.clear()
+
+    def teardown_method(self):
+        agent._cognito_token_cache.clear()
+
+    def _cache_token(self, token: str) -> None:
+        agent._cognito_token_cache["token"] = token
+        agent._cognito_token_cache["expires_at"] = time.time() + 3000
+
+    def test_rotated_token_is_sent_on_next_request(self):
+        """A long-lived Gateway client should pick up the current cached token."""
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200)
+
+        async def two_requests() -> None:
+            async with httpx.AsyncClient(
+                auth=agent.CognitoBearerAuth(), transport=httpx.MockTransport(handler)
+            ) as client:
+                self._cache_token("tok-1")
+                await client.post("https://gateway.example.com/mcp")
+                self._cache_token("tok-2")
+                await client.post("https://gateway.example.com/mcp")
+
+        asyncio.run(two_requests())
+
+        assert seen == ["Bearer tok-1", "Bearer tok-2"]
+
+    def test_cache_hit_skips_token_loop(self):
+        """A valid cached token should be sent without calling _get_cognito_access_token()."""
+        self._cache_token("tok-1")
+        request = httpx.Request("POST", "https://gateway.example.com/mcp")
+
+        async def authorize() -> httpx.Request:
+            return await agent.CognitoBearerAuth().async_auth_flow(request).__anext__()
+
+        with patch.object(agent, "_get_cognito_access_token") as mock_get:
+            authorized = asyncio.run(authorize())
+
+        assert authorized.headers["Authorization"] == "Bearer tok-1"
+        mock_get.assert_not_called()
+
+
+class TestCognitoRefresher:
+    """Tests for the _cognito_refresher() background task."""
+
+    def setup_method(self):
+        agent._cognito_token_cache.clear()
+
+    def teardown_method(self):
+        agent._cognito_token_cache.clear()
+
+    async def _run_briefly(self) -> None:
+        task = asyncio.create_task(agent._cognito_refresher())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    def test_fetches_without_forcing_when_nothing_cached(self):
+        """With no cached token the refresher should join the regular fetch."""
+
+        async def fetch(force_refresh: bool = False) -> str:
+            agent._cognito_token_cache["token"] = "tok-1"
+            agent._cognito_token_cache["expires_at"] = time.time() + 3000
+            return "tok-1"
+
+        with patch.object(
+            agent, "_get_cognito_access_token", AsyncMock(side_effect=fetch)
+        ) as mock_get:
+            asyncio.run(self._run_briefly())
+
+        mock_get.assert_awaited_once_with(force_refresh=False)
+
+    def test_short_lived_token_does_not_busy_loop(self):
+        """A refresh that leaves the token due again should still wait before the next."""
+
+        async def fetch(force_refresh: bool = False) -> str:
+            agent._cognito_token_cache["token"] = "tok-1"
+            agent._cognito_token_cache["expires_at"] = time.time()
+            return "tok-1"
+
+        with patch.object(
+            agent, "_get_cognito_access_token", AsyncMock(side_effect=fetch)
+        ) as mock_get:
+            asyncio.run(self._run_briefly())
+
+        assert mock_get.await_count == 1
+
+    def test_waits_while_cached_token_is_fresh(self):
+        """A token already prefetched at startup should not be refreshed again."""
+        agent._cognito_token_cache["token"] = "tok-1"
+        agent._cognito_token_cache["expires_at"] = time.time() + 3000
+
+        with patch.object(agent, "_get_cognito_access_token", AsyncMock()) as mock_get:
+            asyncio.run(self._run_briefly())
+
+        mock_get.assert_not_awaited()
+
+
+class TestWarmAuth:
+    """Tests for _warm_auth() function."""
+
+    def test_prefetches_token(self):
+        """Warm-up should resolve the Cognito token once."""
+        with patch.object(agent, "get_cognito_access_token") as mock_get:
+            agent._warm_auth()
+
+        mock_get.assert_called_once_with()
+
+    def test_failure_is_not_raised(self):
+        """Warm-up failures must not break container init."""
+        with patch.object(agent, "get_cognito_access_token", side_effect=RuntimeError("boom")):
+            agent._warm_auth()
+
+
+class TestWarmAgent:
+    """Tests for _warm_agent() function."""
+
+    def test_creates_agent_once(self):
+        """Warm-up should create the shared agent only if it does not exist yet."""
+        with (
+            patch.object(agent, "_agent", None),
+            patch.object(agent, "_create_agent", return_value=MagicMock()) as mock_create,
+        ):
+            agent._warm_agent()
+            agent._warm_agent()
+
+        mock_create.assert_called_once_with()
+
+    def test_failure_is_not_raised(self):
+        """Warm-up failures must not break startup; the first request retries."""
+        with (
+            patch.object(agent, "_agent", None),
+            patch.object(agent, "_create_agent", side_effect=RuntimeError("gateway down")),
+        ):
+            agent._warm_agent()
+            assert agent._agent is None
+
+
+class TestGetGoogleTokenSync:
+    """Tests for get_google_token_sync() function."""
+
+    async def _token_for_current_user(self) -> str:
+        return f"token-for-{agent._current_user_id.get()}"
+
+    def test_preserves_caller_context(self):
+        """The token lookup should see the caller's _current_user_id."""
+        reset_token = agent._current_user_id.set("U_USER_1")
+        try:
+            with patch.object(agent, "_get_google_token", self._token_for_current_user):
+                result = agent.get_google_token_sync()
+        finally:
+            agent._current_user_id.reset(reset_token)
+
+        assert result == "token-for-U_USER_1"
+
+    def test_works_inside_running_event_loop(self):
+        """Calling from a thread with a running event loop must not deadlock."""
+
+        async def call_sync() -> str:
+            agent._current_user_id.set("U_USER_2")
+            return agent.get_google_token_sync()
+
+        with patch.object(agent, "_get_google_token", self._token_for_current_user):
+            result = asyncio.run(call_sync())
+
+        assert result == "token-for-U_USER_2"
+
+    def test_propagates_auth_required(self):
+        """AuthRequiredError raised on the token loop should reach the caller."""
+
+        async def raise_auth_required() -> str:
+            raise agent.AuthRequiredError("https://auth.example.com")
+
+        with (
+            patch.object(agent, "_get_google_token", raise_auth_required),
+            pytest.raises(agent.AuthRequiredError) as exc_info,
+        ):
+            agent.get_google_token_sync()
+
+        assert exc_info.value.auth_url == "https://auth.example.com"
+
+
+class TestGetSystemPrompt:
+    """Tests for _get_system_prompt() function."""
+
+    def setup_method(self):
+        agent._prompt_cache = None
+
+    def test_prompt_contains_current_jst_minute(self):
+        """The prompt should embed the current JST date and time."""
+        fixed = datetime(2026, 1, 5, 9, 30, 15, tzinfo=JST)
+        with patch.object(agent, "datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed
+
+            prompt = agent._get_system_prompt()
+
+        assert "2026年01月05日 09:30" in prompt
+
+    def test_prompt_is_reused_within_same_minute(self):
+        """The formatted prompt should be cached until the minute changes."""
+        with patch.object(agent, "datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 5, 9, 30, 1, tzinfo=JST)
+            first = agent._get_system_prompt()
+            mock_datetime.now.return_value = datetime(2026, 1, 5, 9, 30, 59, tzinfo=JST)
+            second = agent._get_system_prompt()
+            mock_datetime.now.return_value = datetime(2026, 1, 5, 9, 31, 0, tzinfo=JST)
+            third = agent._get_system_prompt()
+
+        assert first is second
+        assert "09:31" in third
+
+
+class TestGetAgent:
+    """Tests for _get_agent() function."""
+
+    def setup_method(self):
+        agent._agent = None
+        self._mcp_client_patch = patch.object(agent, "mcp_client")
+        self.mock_mcp_client = self._mcp_client_patch.start()
+        self.mock_mcp_client.is_session_active.return_value = True
+
+    def teardown_method(self):
+        self._mcp_client_patch.stop()
+        agent._agent = None
+
+    def test_agent_is_created_once(self):
+        """The agent should be created on first use and reused afterwards."""
+        mock_agent = MagicMock()
+        with patch.object(agent, "_create_agent", return_value=mock_agent) as mock_create:
+            first = agent._get_agent()
+            second = agent._get_agent()
+
+        assert first is mock_agent
+        assert second is mock_agent
+        mock_create.assert_called_once()
+
+    def test_reused_agent_is_reset(self):
+        """A reused agent should get a fresh prompt and no previous history."""
+        mock_agent = MagicMock()
+        mock_agent.system_prompt = "old prompt"
+        mock_agent.messages = [{"role": "user", "content": [{"text": "previous"}]}]
+        agent._agent = mock_agent
+
+        with patch.object(agent, "_get_system_prompt", return_value="new prompt"):
+            result = agent._get_agent()
+
+        assert result.system_prompt == "new prompt"
+        assert result.messages == []
+
+    def test_inactive_session_rebuilds_agent(self):
+        """A dropped MCP session should replace the agent and its MCP client."""
+        stale_agent = MagicMock()
+        new_agent = MagicMock()
+        new_client = MagicMock()
+        agent._agent = stale_agent
+        self.mock_mcp_client.is_session_active.return_value = False
+
+        with (
+            patch.object(agent, "_create_agent", return_value=new_agent),
+            patch.object(agent, "_create_mcp_client", return_value=new_client),
+        ):
+            result = agent._get_agent()
+            assert agent.mcp_client is new_client
+
+        assert result is new_agent
+        stale_agent.cleanup.assert_called_once()
+
+    def test_mcp_failure_discards_agent(self):
+        """An MCP session error during a run should force a reconnect next time."""
+        failing_agent = MagicMock(side_effect=agent.MCPClientInitializationError("closed"))
+        agent._agent = failing_agent
+
+        with (
+            patch.object(agent, "_create_mcp_client", return_value=MagicMock()),
+            pytest.raises(agent.MCPClientInitializationError),
+        ):
+            agent._run_agent("hello")
+
+        assert vars(agent)["_agent"] is None
+        failing_agent.cleanup.assert_called_once()
+
+
+class TestCreateAgent:
+    """Tests for _create_agent() function."""
+
+    def test_uses_pinned_bedrock_model(self):
+        """The agent should run on BEDROCK_MODEL_ID, not the Strands default model."""
+        with (
+            patch.object(agent, "BedrockModel") as mock_model,
+            patch.object(agent, "Agent") as mock_agent_cls,
+        ):
+            agent._create_agent()
+
+        mock_model.assert_called_once_with(model_id=agent.BEDROCK_MODEL_ID)
+        assert mock_agent_cls.call_args.kwargs["model"] is mock_model.return_value
+
+
+class TestAgentInvocation:
+    """Tests for agent_invocation() entrypoint."""
+
+    async def _collect(self, payload: dict) -> list[dict]:
+        return [event async for event in agent.agent_invocation(payload, MagicMock())]
+
+    def test_user_id_is_scoped_to_invocation(self):
+        """user_id should be visible during the call and restored afterwards."""
+        seen_user_ids = []
+        mock_agent = MagicMock()
+
+        def run_agent(message):
+            seen_user_ids.append(agent._current_user_id.get())
+            return MagicMock(message={"role": "assistant", "content": [{"text": "ok"}]})
+
+        mock_agent.side_effect = run_agent
+
+        async def run() -> tuple[list[dict], str | None]:
+            events = await self._collect({"prompt": "hello", "user_id": "U_USER_1"})
+            return events, agent._current_user_id.get()
+
+        with patch.object(agent, "_get_agent", return_value=mock_agent):
+            events, user_id_after = asyncio.run(run())
+
+        assert events[0]["status"] == "success"
+        assert seen_user_ids == ["U_USER_1"]
+        assert user_id_after is None
+
+    def test_agent_runs_off_event_loop_thread(self):
+        """The synchronous agent call should not block the event loop thread."""
+        agent_threads = []
+        mock_agent = MagicMock()
+
+        def run_agent(message):
+            agent_threads.append(threading.get_ident())
+            return MagicMock(message={"role": "assistant", "content": [{"text": "ok"}]})
+
+        mock_agent.side_effect = run_agent
+
+        async def run() -> int:
+            await self._collect({"prompt": "hello"})
+            return threading.get_ident()
+
+        with patch.object(agent, "_get_agent", return_value=mock_agent):
+            loop_thread = asyncio.run(run())
+
+        assert len(agent_threads) == 1
+        assert agent_threads[0] != loop_thread
+
+    def test_missing_prompt_returns_error(self):
+        """An empty prompt should yield an error without invoking the agent."""
+        with patch.object(agent, "_get_agent") as mock_get_agent:
+            events = asyncio.run(self._collect({"user_id": "U_USER_1"}))
+
+        assert events == [{"error": "No prompt found in payload", "status": "error"}]
+        mock_get_agent.assert_not_called()
+
+
+class TestAuthInjectingMCPClient:
+    """Tests for AuthInjectingMCPClient.call_tool_sync() token injection."""
+
+    def _client(self) -> agent.AuthInjectingMCPClient:
+        return agent.AuthInjectingMCPClient(lambda: None)
+
+    def test_injects_token_for_calendar_tools(self):
+        """calendar___ tools should receive the Google access_token."""
+        arguments = {"start_date": "2026-01-05"}
+        with (
+            patch.object(agent, "get_google_token_sync", return_value="g-token"),
+            patch.object(agent.MCPClient, "call_tool_sync", return_value="result") as mock_call,
+        ):
+            result = self._client().call_tool_sync("tool-1", "calendar___get_events", arguments)
+
+        assert result == "result"
+        assert mock_call.call_args.args[2]["access_token"] == "g-token"
+
+    def test_skips_token_for_other_tools(self):
+        """Tools without the calendar___ prefix should be passed through untouched."""
+        arguments = {"query": "x"}
+        with (
+            patch.object(agent, "get_google_token_sync") as mock_token,
+            patch.object(agent.MCPClient, "call_tool_sync", return_value="result"),
+        ):
+            self._client().call_tool_sync("tool-1", "search___query", arguments)
+
+        assert "access_token" not in arguments
+        mock_token.assert_not_called()
+
+    def test_returns_auth_url_when_auth_required(self):
+        """AuthRequiredError should become an error tool result with the auth URL."""
+        with (
+            patch.object(
+                agent,
+                "get_google_token_sync",
+                side_effect=agent.AuthRequiredError("https://auth.example.com"),
+            ),
+            patch.object(agent.MCPClient, "call_tool_sync") as mock_call,
+        ):
+            result = self._client().call_tool_sync("tool-1", "calendar___get_events", {})
+
+        assert result["status"] == "error"
+        assert "https://auth.example.com" in result["content"][0]["text"]
+        mock_call.assert_not_called()
+
+    def test_cache_hit_skips_token_loop(self):
+        """A valid cached token should be injected without calling get_google_token_sync()."""
+        reset_token = agent._current_user_id.set("U_USER_1")
+        agent._google_token_cache["U_USER_1"] = ("cached-token", time.time() + 3000)
+        arguments: dict[str, str] = {}
+        try:
+            with (
+                patch.object(agent, "get_google_token_sync") as mock_token,
+                patch.object(agent.MCPClient, "call_tool_sync", return_value="result"),
+            ):
+                self._client().call_tool_sync("tool-1", "calendar___get_events", arguments)
+        finally:
+            agent._current_user_id.reset(reset_token)
+            agent._google_token_cache.clear()
+
+        assert arguments["access_token"] == "cached-token"
+        mock_token.assert_not_called()
+
+
+class TestAuthInjectingMCPClientAsync:
+    """Tests for AuthInjectingMCPClient.call_tool_async() token injection."""
+
+    def test_concurrent_calls_get_their_users_token(self):
+        """Concurrent calendar tool calls should each receive the caller's token."""
+
+        async def token_for_current_user() -> str:
+            await asyncio.sleep(0.05)
+            return f"token-for-{agent._current_user_id.get()}"
+
+        async def call(user_id: str, arguments: dict[str, str]) -> None:
+            agent._current_user_id.set(user_id)
+            await client.call_tool_async("tool-1", "calendar___get_events", arguments)
+
+        async def run_both() -> None:
+            await asyncio.gather(call("U_USER_1", first), call("U_USER_2", second))
+
+        client = agent.AuthInjectingMCPClient(lambda: None)
+        first: dict[str, str] = {}
+        second: dict[str, str] = {}
+        with (
+            patch.object(agent, "_get_google_token", token_for_current_user),
+            patch.object(agent.MCPClient, "call_tool_async", new=AsyncMock(return_value=OK_RESULT)),
+        ):
+            asyncio.run(run_both())
+
+        assert first["access_token"] == "token-for-U_USER_1"
+        assert second["access_token"] == "token-for-U_USER_2"
+
+    def test_identical_concurrent_reads_are_coalesced(self):
+        """Identical in-flight get_events calls should share one Gateway request."""
+
+        async def slow_call(tool_use_id, name, arguments, read_timeout_seconds):
+            await asyncio.sleep(0.05)
+            return {**OK_RESULT, "toolUseId": tool_use_id}
+
+        async def run_both() -> tuple[Any, Any]:
+            return await asyncio.gather(
+                client.call_tool_async("tool-1", "calendar___get_events", {"start_date": "d"}),
+                client.call_tool_async("tool-2", "calendar___get_events", {"start_date": "d"}),
+            )
+
+        client = agent.AuthInjectingMCPClient(lambda: None)
+        reset_token = agent._current_user_id.set("U_USER_1")
+        agent._google_token_cache["U_USER_1"] = ("cached-token", time.time() + 3000)
+        try:
+            with patch.object(
+                agent.MCPClient, "call_tool_async", new=AsyncMock(side_effect=slow_call)
+            ) as mock_call:
+                results = asyncio.run(run_both())
+        finally:
+            agent._current_user_id.reset(reset_token)
+            agent._google_token_cache.clear()
+
+        mock_call.assert_called_once()
+        assert [r["toolUseId"] for r in results] == ["tool-1", "tool-2"]
+        assert not client._in_flight
+
+
+class TestToolCatalogCache:
+    """Tests for AuthInjectingMCPClient.list_tools_sync() disk catalog."""
+
+    def _tools(self, client: agent.MCPClient) -> agent.PaginatedList:
+        tool = agent.Tool(name="calendar___get_events", inputSchema={"type": "object"})
+        return agent.PaginatedList([agent.MCPAgentTool(tool, client)])
+
+    def test_second_process_reads_catalog_from_disk(self, tmp_path):
+        """A fresh catalog on disk should be used instead of listing tools from the Gateway."""
+        path = str(tmp_path / "catalog.json")
+        first_client = agent.AuthInjectingMCPClient(lambda: None, tool_catalog_path=path)
+        second_client = agent.AuthInjectingMCPClient(lambda: None, tool_catalog_path=path)
+
+        with patch.object(
+            agent.MCPClient, "list_tools_sync", return_value=self._tools(first_client)
+        ) as mock_list:
+            first_client.list_tools_sync()
+            tools = second_client.list_tools_sync()
+
+        mock_list.assert_called_once()
+        assert [t.tool_name for t in tools] == ["calendar___get_events"]
+        assert tools[0].mcp_client is second_client
+
+    def test_access_token_is_hidden_from_model(self):
+        """Calendar tool specs should not expose the injected access_token parameter."""
+        tool = agent.Tool(
+            name="calendar___get_events",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "access_token": {"type": "string"},
+                    "start_date": {"type": "string"},
+                },
+                "required": ["access_token", "start_date"],
+            },
+        )
+        client = agent.AuthInjectingMCPClient(lambda: None)
+
+        with patch.object(
+            agent.MCPClient,
+            "list_tools_sync",
+            return_value=agent.PaginatedList([agent.MCPAgentTool(tool, client)]),
+        ):
+            tools = client.list_tools_sync()
+
+        schema = tools[0].tool_spec["inputSchema"]["json"]
+        assert list(schema["properties"]) == ["start_date"]
+        assert schema["required"] == ["start_date"]
+
+    def test_catalog_path_changes_with_version(self):
+        """Bumping the catalog version should point at a different cache file."""
+        endpoint = "https://gateway.example.com/mcp"
+        assert agent._tool_catalog_path(endpoint) == agent._tool_catalog_path(endpoint)
+        assert agent._tool_catalog_path(endpoint, "v2") != agent._tool_catalog_path(endpoint)
+
+    def test_stale_catalog_is_refreshed(self, tmp_path):
+        """A catalog older than the TTL should trigger a new Gateway listing."""
+        path = tmp_path / "catalog.json"
+        path.write_bytes(b"[]")
+        stale = time.time() - agent.MCP_TOOL_CATALOG_TTL_SECONDS - 1
+        os.utime(path, (stale, stale))
+        client = agent.AuthInjectingMCPClient(lambda: None, tool_catalog_path=str(path))
+
+        with patch.object(
+            agent.MCPClient, "list_tools_sync", return_value=self._tools(client)
+        ) as mock_list:
+            tools = client.list_tools_sync()
+
+        mock_list.assert_called_once()
+        assert len(tools) == 1
+
+
+class TestGetGoogleToken:
+    """Tests for _get_google_token() per-user cache."""
+
+    def setup_method(self):
+        agent._google_token_cache.clear()
+        agent._google_auth_url_cache.clear()
+
+    def teardown_method(self):
+        agent._google_token_cache.clear()
+        agent._google_auth_url_cache.clear()
+
+    def test_cache_is_keyed_by_user(self):
+        """A cached token must only be returned for the user it was issued to."""
+        agent._google_token_cache["U_USER_1"] = ("token-1", time.time() + 3000)
+
+        async def get_for(user_id: str) -> str:
+            agent._current_user_id.set(user_id)
+            return await agent._get_google_token()
+
+        with patch.object(agent, "_fetch_google_token", self._returning("token-2")):
+            first = asyncio.run(get_for("U_USER_1"))
+            second = asyncio.run(get_for("U_USER_2"))
+
+        assert first == "token-1"
+        assert second == "token-2"
+        assert agent._google_token_cache["U_USER_2"][0] == "token-2"
+
+    def test_refreshes_before_expiry(self):
+        """A token inside the refresh margin is refetched instead of being returned."""
+        agent._google_token_cache["U_USER_1"] = ("token-old", time.time() - 1)
+
+        async def get_token() -> str:
+            agent._current_user_id.set("U_USER_1")
+            return await agent._get_google_token()
+
+        with patch.object(agent, "_fetch_google_token", self._returning("token-new")):
+            token = asyncio.run(get_token())
+
+        token_cached, expires_at = agent._google_token_cache["U_USER_1"]
+        assert token == token_cached == "token-new"
+        assert expires_at == pytest.approx(
+            time.time() + agent.GOOGLE_TOKEN_CACHE_TTL_SECONDS, abs=5
+        )
+
+    def test_auth_url_is_negatively_cached(self):
+        """A user who needs consent should get the cached auth URL without a new lookup."""
+        fetch_calls = 0
+
+        async def fetch_token(user_id: str | None) -> tuple[str, int]:
+            nonlocal fetch_calls
+            fetch_calls += 1
+            raise agent.AuthRequiredError("https://auth.example.com")
+
+        async def get_token() -> str:
+            agent._current_user_id.set("U_USER_1")
+            return await agent._get_google_token()
+
+        with patch.object(agent, "_fetch_google_token", fetch_token):
+            for _ in range(2):
+                with pytest.raises(agent.AuthRequiredError) as exc_info:
+                    asyncio.run(get_token())
+                assert exc_info.value.auth_url == "https://auth.example.com"
+
+        assert fetch_calls == 1
+
+    def test_fetch_uses_shared_identity_client(self):
+        """Lookups should go through the shared IdentityClient with user_id as custom_state."""
+        with (
+            patch.object(
+                agent.BedrockAgentCoreContext, "get_workload_access_token", return_value="wat"
+            ),
+            patch.object(
+                agent._identity_client, "get_token", AsyncMock(return_value="token-1")
+            ) as mock_get_token,
+        ):
+            result = asyncio.run(agent._fetch_google_token("U_USER_1"))
+
+        assert result == ("token-1", agent.GOOGLE_TOKEN_CACHE_TTL_SECONDS)
+        kwargs = mock_get_token.call_args.kwargs
+        assert kwargs["custom_state"] == "U_USER_1"
+        assert kwargs["agent_identity_token"] == "wat"
+
+    def test_fetch_requires_workload_access_token(self):
+        """A lookup outside a Runtime invocation should fail before calling Identity."""
+        with (
+            patch.object(
+                agent.BedrockAgentCoreContext, "get_workload_access_token", return_value=None
+            ),
+            patch.object(agent._identity_client, "get_token", AsyncMock()) as mock_get_token,
+            pytest.raises(ValueError, match="Workload access token"),
+        ):
+            asyncio.run(agent._fetch_google_token("U_USER_1"))
+
+        mock_get_token.assert_not_called()
+
+    def test_blocking_identity_call_does_not_stall_token_loop(self):
+        """The token loop should keep serving while an Identity lookup blocks."""
+        release = threading.Event()
+
+        async def blocking_lookup(user_id: str | None) -> tuple[str, int]:
+            release.wait(5)  # stands in for the SDK's synchronous boto3 call
+            return "token-1", agent.GOOGLE_TOKEN_CACHE_TTL_SECONDS
+
+        with patch.object(agent, "_identity_token_lookup", blocking_lookup):
+            lookup = agent._submit_google_token_lookup()
+            try:
+                probe = asyncio.run_coroutine_threadsafe(asyncio.sleep(0), agent._token_loop)
+                probe.result(timeout=1)
+            finally:
+                release.set()
+            assert lookup.result(timeout=5) == "token-1"
+
+    @staticmethod
+    def _returning(token: str):
+        async def fetch_token(user_id: str | None) -> tuple[str, int]:
+            return token, agent.GOOGLE_TOKEN_CACHE_TTL_SECONDS
+
+        return fetch_token
@@ -2,12 +2,19 @@
 Unit tests for Slack receiver response logic.
 
 Tests the is_bot_in_thread() and should_respond() functions
-to ensure correct bot response behavior.
+to ensure correct bot response behavior, and verify_slack_request()
+signature checking.
 """
 
-from unittest.mock import MagicMock
+import hashlib
+import hmac
+import time
+from unittest.mock import MagicMock, patch
 
-from interfaces.slack.receiver import is_bot_in_thread, should_respond
+import pytest
+
+from interfaces.slack import receiver
+from interfaces.slack.receiver import is_bot_in_thread, should_respond, verify_slack_request
 
 
 class TestIsBotInThread:
@@ -184,3 +191,103 @@ class TestShouldRespond:
         assert result is True
         # Mention check comes first, so get_thread_replies should not be called
         mock_client.get_thread_replies.assert_not_called()
+
+
+SIGNING_SECRET = "test-signing-secret"
+
+
+def _signed_event(body: str, secret: str = SIGNING_SECRET) -> dict:
+    """Build a Lambda event signed the way Slack signs requests."""
+    timestamp = str(int(time.time()))
+    digest = hmac.new(secret.encode(), f"v0:{timestamp}:{body}".encode(), hashlib.sha256)
+    return {
+        "headers": {
+            "X-Slack-Signature": "v0=" + digest.hexdigest(),
+            "X-Slack-Request-Timestamp": timestamp,
+        },
+        "body": body,
+    }
+
+
+class TestVerifySlackRequest:
+    """Tests for verify_slack_request() function."""
+
+    def test_valid_signatures_with_cached_signer(self):
+        """Repeated requests should verify against the cached signer."""
+        credentials = {"SLACK_SIGNING_SECRET": SIGNING_SECRET}
+        with patch.object(receiver, "get_slack_credentials", return_value=credentials):
+            assert verify_slack_request(_signed_event('{"a": 1}')) is True
+            assert verify_slack_request(_signed_event('{"b": 2}')) is True
+
+    def test_invalid_signature(self):
+        """A request signed with another secret should be rejected."""
+        credentials = {"SLACK_SIGNING_SECRET": SIGNING_SECRET}
+        with patch.object(receiver, "get_slack_credentials", return_value=credentials):
+            assert verify_slack_request(_signed_event("{}", secret="other")) is False
+
+    def test_signer_follows_secret_rotation(self):
+        """A changed signing secret should rebuild the cached signer."""
+        with patch.object(
+            receiver, "get_slack_credentials", return_value={"SLACK_SIGNING_SECRET": "old"}
+        ):
+            assert verify_slack_request(_signed_event("{}", secret="old")) is True
+        with patch.object(
+            receiver, "get_slack_credentials", return_value={"SLACK_SIGNING_SECRET": "new"}
+        ):
+            assert verify_slack_request(_signed_event("{}", secret="new")) is True
+
+
+class TestHandler:
+    """Tests for handler() body handling."""
+
+    def test_url_verification_uses_signed_body(self):
+        """The raw body should be verified and then parsed for the challenge."""
+        event = _signed_event('{"type": "url_verification", "challenge": "abc"}')
+        credentials = {"SLACK_SIGNING_SECRET": SIGNING_SECRET}
+        with patch.object(receiver, "get_slack_credentials", return_value=credentials):
+            response = receiver.handler(event, None)
+
+        assert response["statusCode"] == 200
+        assert response["body"] == '{"challenge":"abc"}'
+
+    def test_invalid_signature_rejected_before_parsing(self):
+        """A forged request should get 401 even if its body is not JSON."""
+        event = _signed_event("not json", secret="other")
+        credentials = {"SLACK_SIGNING_SECRET": SIGNING_SECRET}
+        with patch.object(receiver, "get_slack_credentials", return_value=credentials):
+            response = receiver.handler(event, None)
+
+        assert response["statusCode"] == 401
+
+    def test_slack_retry_is_acknowledged_without_invoking_worker(self):
+        """A retried delivery should be acked without invoking the worker again."""
+        event = _signed_event('{"type": "event_callback", "event": {"type": "message"}}')
+        event["headers"]["X-Slack-Retry-Num"] = "1"
+        event["headers"]["X-Slack-Retry-Reason"] = "http_timeout"
+        credentials = {"SLACK_SIGNING_SECRET": SIGNING_SECRET}
+        with (
+            patch.object(receiver, "get_slack_credentials", return_value=credentials),
+            patch.object(receiver, "get_lambda_client") as mock_lambda_client,
+        ):
+            response = receiver.handler(event, None)
+
+        assert response["statusCode"] == 200
+        mock_lambda_client.assert_not_called()
+
+    @pytest.mark.parametrize("retry_reason", ["http_error", "unknown_error"])
+    def test_slack_retry_after_error_invokes_worker(self, retry_reason):
+        """A retry after a failed delivery may be the first to reach the worker."""
+        event = _signed_event('{"type": "event_callback", "event": {"type": "message"}}')
+        event["headers"]["X-Slack-Retry-Num"] = "1"
+        event["headers"]["X-Slack-Retry-Reason"] = retry_reason
+        credentials = {"SLACK_SIGNING_SECRET": SIGNING_SECRET, "SLACK_BOT_TOKEN": "xoxb-test"}
+        with (
+            patch.object(receiver, "get_slack_credentials", return_value=credentials),
+            patch.object(receiver, "SlackClient"),
+            patch.object(receiver, "should_respond", return_value=True),
+            patch.object(receiver, "get_lambda_client") as mock_lambda_client,
+        ):
+            response = receiver.handler(event, None)
+
+        assert response["statusCode"] == 200
+        mock_lambda_client.return_value.invoke.assert_called_once()
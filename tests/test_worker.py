@@ -0,0 +1,151 @@
+"""
+Unit tests for the Slack worker handler.
+
+Tests the delayed "thinking" message flow in handler()
+without calling Slack or AgentCore.
+"""
+
+import os
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "ap-northeast-1")
+
+from interfaces.slack.worker import handler as worker  # noqa: E402
+
+CREDENTIALS = {"SLACK_BOT_TOKEN": "xoxb-test"}
+EVENT: dict[str, Any] = {
+    "event": {"type": "message", "text": "<@UBOT123> 今日の予定は？", "ts": "1700000000.000100"},
+    "user_id": "U_USER_1",
+    "team_id": "T_TEAM_1",
+    "channel_id": "C_CHANNEL_1",
+    "thread_id": "1700000000.000100",
+    "event_id": "Ev_1",
+}
+
+
+@pytest.fixture
+def slack_client() -> Iterator[MagicMock]:
+    client = MagicMock(spec=worker.SlackClient)
+    client.post_message.return_value = {"ok": True, "ts": "1700000000.000200"}
+    with (
+        patch.object(worker, "get_slack_credentials", return_value=CREDENTIALS),
+        patch.object(worker, "SlackClient", return_value=client),
+    ):
+        yield client
+
+
+class TestHandler:
+    """Tests for handler() response delivery."""
+
+    def test_fast_answer_is_posted_without_thinking_message(self, slack_client):
+        """An answer within the delay should be posted once, with no update."""
+        with patch.object(worker._agent_client, "invoke_agent", return_value="予定はありません"):
+            response = worker.handler(EVENT, None)
+
+        assert response["statusCode"] == 200
+        slack_client.post_message.assert_called_once_with(
+            channel="C_CHANNEL_1", text="予定はありません", thread_ts="1700000000.000100"
+        )
+        slack_client.update_message.assert_not_called()
+
+    def test_slow_answer_updates_thinking_message(self, slack_client):
+        """An answer after the delay should replace the "thinking" message."""
+        with (
+            patch.object(worker, "THINKING_DELAY_SECONDS", 0.01),
+            patch.object(
+                worker._agent_client, "invoke_agent", side_effect=self._slow("予定はありません")
+            ),
+        ):
+            response = worker.handler(EVENT, None)
+
+        assert response["statusCode"] == 200
+        slack_client.post_message.assert_called_once_with(
+            channel="C_CHANNEL_1", text="考え中...", thread_ts="1700000000.000100"
+        )
+        slack_client.update_message.assert_called_once_with(
+            channel="C_CHANNEL_1", ts="1700000000.000200", text="予定はありません"
+        )
+
+    def test_failed_thinking_post_falls_back_to_posting_answer(self, slack_client):
+        """The answer should still be posted when the "thinking" post failed."""
+        slack_client.post_message.side_effect = [Exception("Slack API error"), {"ok": True}]
+        with (
+            patch.object(worker, "THINKING_DELAY_SECONDS", 0.01),
+            patch.object(
+                worker._agent_client, "invoke_agent", side_effect=self._slow("予定はありません")
+            ),
+        ):
+            response = worker.handler(EVENT, None)
+
+        assert response["statusCode"] == 200
+        assert slack_client.post_message.call_args.kwargs["text"] == "予定はありません"
+        slack_client.update_message.assert_not_called()
+
+    def test_agent_failure_cancels_thinking_message(self, slack_client):
+        """A failed agent call should not leave a "thinking" post behind."""
+        with (
+            patch.object(worker, "THINKING_DELAY_SECONDS", 0.05),
+            patch.object(worker._agent_client, "invoke_agent", side_effect=RuntimeError("boom")),
+        ):
+            response = worker.handler(EVENT, None)
+        # Give a leaked delayed post time to fire
+        threading.Event().wait(0.1)
+
+        assert response["statusCode"] == 500
+        slack_client.post_message.assert_not_called()
+
+    def test_empty_message_skips_slack_and_agent(self, slack_client):
+        """A message that is only a mention should return before any Slack call."""
+        event = {**EVENT, "event": {**EVENT["event"], "text": "<@UBOT123>"}}
+        with patch.object(worker._agent_client, "invoke_agent") as mock_invoke:
+            response = worker.handler(event, None)
+
+        assert response["body"] == "Empty message"
+        mock_invoke.assert_not_called()
+        slack_client.post_message.assert_not_called()
+
+    @staticmethod
+    def _slow(answer: str):
+        def invoke_agent(**_kwargs: Any) -> str:
+            threading.Event().wait(0.1)
+            return answer
+
+        return invoke_agent
+
+
+class TestSlackClient:
+    """Tests for SlackClient._post_json() via post_message()."""
+
+    def _response(self, status: int, data: bytes) -> MagicMock:
+        response = MagicMock()
+        response.status = status
+        response.data = data
+        return response
+
+    def test_posts_json_with_bot_token(self):
+        """The payload should be sent as JSON with the bot token."""
+        with patch.object(worker, "_http_pool") as mock_pool:
+            mock_pool.request.return_value = self._response(200, b'{"ok": true, "ts": "1.2"}')
+            result = worker.SlackClient("xoxb-test").post_message("C1", "hi", thread_ts="1.0")
+
+        assert result["ts"] == "1.2"
+        args, kwargs = mock_pool.request.call_args
+        assert args == ("POST", "https://slack.com/api/chat.postMessage")
+        assert kwargs["headers"]["Authorization"] == "Bearer xoxb-test"
+        assert kwargs["body"] == b'{"channel":"C1","text":"hi","thread_ts":"1.0"}'
+
+    @pytest.mark.parametrize(
+        ("status", "data"),
+        [(500, b""), (200, b'{"ok": false, "error": "channel_not_found"}')],
+    )
+    def test_failure_raises(self, status, data):
+        """HTTP errors and ok=false responses should raise."""
+        with patch.object(worker, "_http_pool") as mock_pool:
+            mock_pool.request.return_value = self._response(status, data)
+            with pytest.raises(Exception, match="Slack API"):
+                worker.SlackClient("xoxb-test").update_message("C1", "1.2", "hi")